@@ -37,15 +37,26 @@ import argparse
 import csv
 import logging
 import re
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     import yaml
 except ImportError as e:
     raise SystemExit("Missing dependency 'pyyaml'. Install with: pip install pyyaml") from e
 
+from fast_yaml_vocab import dump_vocab
+
+# Prefer the LibYAML-backed C loader; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 # -----------------------------------------------------------------------------
 # Logging
@@ -79,7 +90,54 @@ CANON_CATS = {
     "numeral", "proper noun", "noun_phrase", "other"
 }
 
+# Light normalization of CEFR-list category labels
+CAT_MAP = {
+    "det": "article",
+    "artikel": "article",
+    "n": "noun",
+    "noun": "noun",
+    "subst": "noun",
+    "verb": "verb",
+    "v": "verb",
+    "adj": "adjective",
+    "adjektiv": "adjective",
+    "adv": "adverb",
+    "pron": "pronoun",
+    "prep": "preposition",
+    "konj": "conjunction",
+    "part": "particle",
+    "num": "numeral",
+}
+
+# raw (normalized) label -> canonical category in one lookup; anything
+# neither canonical nor in CAT_MAP resolves to "other"
+CAT_RESOLVE = {**{c: c for c in CANON_CATS}, **CAT_MAP}
+
+# wordbank categories are already close to canonical; only "det" is remapped
+WORDBANK_CAT_RESOLVE = {**{c: c for c in CANON_CATS}, "det": "article"}
+
+# Minimal spaCy POS -> category
+POS_MAP = {
+    "DET": "article",
+    "NOUN": "noun",
+    "PROPN": "proper noun",
+    "VERB": "verb",
+    "AUX": "verb",
+    "ADJ": "adjective",
+    "ADV": "adverb",
+    "PRON": "pronoun",
+    "ADP": "preposition",
+    "CCONJ": "conjunction",
+    "SCONJ": "conjunction",
+    "PART": "particle",
+    "NUM": "numeral",
+    "INTJ": "interjection",
+}
+
 
+# Same few thousand lemmas/categories are normalized again and again
+# (load -> enrich -> merge); a cache hit beats strip().lower().
+@lru_cache(maxsize=65536)
 def norm_key(s: str) -> str:
     return (s or "").strip().lower()
 
@@ -118,9 +176,22 @@ class VocabItem:
     course_examples: str = ""  # short debug string (not full text)
     source: str = "cefr_a1"
 
+    # normalized forms of lemma/category/gender (never reassigned after
+    # construction), computed once for merge lookups and sorting
+    _nlemma: str = field(init=False, repr=False, compare=False)
+    _ncat: str = field(init=False, repr=False, compare=False)
+    _ngender: str = field(init=False, repr=False, compare=False)
+    _key: Tuple[str, str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._nlemma = norm_key(self.lemma)
+        self._ncat = norm_key(self.category)
+        self._ngender = norm_key(self.gender)
+        self._key = (self._nlemma, self._ncat, self._ngender)
+
     def key(self) -> Tuple[str, str, str]:
         # stable merge identity
-        return (norm_key(self.lemma), norm_key(self.category), norm_key(self.gender))
+        return self._key
 
 
 # -----------------------------------------------------------------------------
@@ -128,161 +199,118 @@ class VocabItem:
 # -----------------------------------------------------------------------------
 def detect_delimiter(path: Path) -> str:
     # simple sniff: if tabs are common, treat as TSV
-    sample = path.read_text(encoding="utf-8", errors="replace")[:4000]
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        sample = f.read(4000)
     if sample.count("\t") > sample.count(","):
         return "\t"
     return ","
 
 
-def load_cefr_list(cefr_path: Path) -> List[VocabItem]:
-    if not cefr_path.exists():
-        raise FileNotFoundError(f"CEFR list not found: {cefr_path}")
+def column_getter(header: List[str], names: List[str]) -> Callable[[List[str]], str]:
+    """
+    Resolve candidate columns against the header once and return a row -> value
+    function giving the first non-blank (stripped) candidate value.
+    Duplicate header names resolve to the last occurrence (like DictReader).
+    """
+    col_idx = {name: i for i, name in enumerate(header)}
+    idxs = [col_idx[c] for c in names if c in col_idx]
+
+    if not idxs:
+        return lambda row: ""
+
+    if len(idxs) == 1:
+        # common case: a single matching column, no fall-through needed
+        (i,) = idxs
+        return lambda row: row[i].strip() if i < len(row) else ""
 
+    def first_nonempty(row: List[str]) -> str:
+        for i in idxs:
+            if i < len(row):
+                v = row[i].strip()
+                if v:
+                    return v
+        return ""
+
+    return first_nonempty
+
+
+def _iter_raw_cefr(cefr_path: Path) -> Iterable[Tuple[str, str, str, str]]:
+    """
+    Yield stripped (lemma, category, gender, notes) per CEFR entry, from either
+    a YAML list ({"items": [...]}) or a CSV/TSV with a header row.
+    Entries without a lemma are skipped.
+    """
     # NEW: allow YAML CEFR lists (source-of-truth) as well as CSV
     if cefr_path.suffix.lower() in [".yaml", ".yml"]:
-        data = yaml.safe_load(cefr_path.read_text(encoding="utf-8")) or {}
-        raw_items = data.get("items", [])
-        items: List[VocabItem] = []
-
-        for it in raw_items:
+        data = yaml.load(cefr_path.read_text(encoding="utf-8"), Loader=_Loader) or {}
+        for it in data.get("items", []):
             if not isinstance(it, dict):
                 continue
             raw_lemma = (it.get("lemma") or it.get("text") or it.get("word") or "").strip()
             if not raw_lemma:
                 continue
-
-            raw_cat = (it.get("category") or it.get("pos") or it.get("type") or "").strip()
-            raw_gender = (it.get("gender") or it.get("genus") or "").strip()
-            raw_notes = (it.get("notes") or it.get("note") or "").strip()
-
-            cat = norm_key(raw_cat)
-            if not cat:
-                cat = guess_category_basic(raw_lemma)
-
-            cat_map = {
-                "det": "article",
-                "artikel": "article",
-                "n": "noun",
-                "noun": "noun",
-                "subst": "noun",
-                "verb": "verb",
-                "v": "verb",
-                "adj": "adjective",
-                "adjektiv": "adjective",
-                "adv": "adverb",
-                "pron": "pronoun",
-                "prep": "preposition",
-                "konj": "conjunction",
-                "part": "particle",
-                "num": "numeral",
-            }
-            cat = cat_map.get(cat, cat)
-            if cat not in CANON_CATS:
-                cat = "other"
-
-            items.append(VocabItem(
-                lemma=raw_lemma,
-                category=cat,
-                gender=raw_gender,
-                notes=raw_notes,
-                cefr="A1",
-                seen_in_course=False,
-                source="cefr_a1",
-            ))
-
-        if not items:
-            raise ValueError(f"CEFR YAML produced 0 items. Check file format: {cefr_path}")
-
-        log.info("Loaded CEFR items (YAML): %d", len(items))
-        return items
-
-
-
+            yield (
+                raw_lemma,
+                (it.get("category") or it.get("pos") or it.get("type") or "").strip(),
+                (it.get("gender") or it.get("genus") or "").strip(),
+                (it.get("notes") or it.get("note") or "").strip(),
+            )
+        return
 
     delim = detect_delimiter(cefr_path)
-    items: List[VocabItem] = []
-
-    with cefr_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter=delim)
-        if not reader.fieldnames:
+    with cefr_path.open("r", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(f, delimiter=delim)
+        header = next(reader, None)
+        if not header:
             raise ValueError(f"CEFR file has no headers: {cefr_path}")
 
-        # acceptable lemma columns
-        lemma_cols = ["lemma", "word", "token", "text"]
-        cat_cols = ["category", "pos", "type"]
-        gender_cols = ["gender", "genus"]
-        notes_cols = ["notes", "note", "comment", "comments"]
+        # acceptable lemma columns (resolved once, from the header);
+        # getters already return stripped values
+        get_lemma = column_getter(header, ["lemma", "word", "token", "text"])
+        get_cat = column_getter(header, ["category", "pos", "type"])
+        get_gender = column_getter(header, ["gender", "genus"])
+        get_notes = column_getter(header, ["notes", "note", "comment", "comments"])
 
         for row in reader:
-            raw_lemma = ""
-            for c in lemma_cols:
-                if c in row and (row[c] or "").strip():
-                    raw_lemma = row[c].strip()
-                    break
-
+            if not row:
+                continue
+            raw_lemma = get_lemma(row)
             if not raw_lemma:
                 continue
+            yield raw_lemma, get_cat(row), get_gender(row), get_notes(row)
 
-            raw_cat = ""
-            for c in cat_cols:
-                if c in row and (row[c] or "").strip():
-                    raw_cat = row[c].strip()
-                    break
-
-            raw_gender = ""
-            for c in gender_cols:
-                if c in row and (row[c] or "").strip():
-                    raw_gender = row[c].strip()
-                    break
-
-            raw_notes = ""
-            for c in notes_cols:
-                if c in row and (row[c] or "").strip():
-                    raw_notes = row[c].strip()
-                    break
-
-            cat = norm_key(raw_cat)
-            if not cat:
-                # fall back to heuristic
-                cat = guess_category_basic(raw_lemma)
-
-            # normalize category labels lightly
-            cat_map = {
-                "det": "article",
-                "artikel": "article",
-                "n": "noun",
-                "noun": "noun",
-                "subst": "noun",
-                "verb": "verb",
-                "v": "verb",
-                "adj": "adjective",
-                "adjektiv": "adjective",
-                "adv": "adverb",
-                "pron": "pronoun",
-                "prep": "preposition",
-                "konj": "conjunction",
-                "part": "particle",
-                "num": "numeral",
-            }
-            cat = cat_map.get(cat, cat)
-            if cat not in CANON_CATS:
-                # keep it but avoid chaos
-                cat = "other"
-
-            items.append(VocabItem(
-                lemma=raw_lemma.strip(),
-                category=cat,
-                gender=raw_gender.strip(),
-                notes=raw_notes.strip(),
-                cefr="A1",
-                seen_in_course=False,
-                source="cefr_a1",
-            ))
 
+def load_cefr_list(cefr_path: Path) -> List[VocabItem]:
+    if not cefr_path.exists():
+        raise FileNotFoundError(f"CEFR list not found: {cefr_path}")
+
+    items: List[VocabItem] = []
+
+    for raw_lemma, raw_cat, raw_gender, raw_notes in _iter_raw_cefr(cefr_path):
+        cat = norm_key(raw_cat)
+        if not cat:
+            # fall back to heuristic
+            cat = guess_category_basic(raw_lemma)
+
+        # normalize category labels lightly; unknown labels become "other"
+        cat = CAT_RESOLVE.get(cat, "other")
+
+        # small closed sets: share one string object per value
+        items.append(VocabItem(
+            lemma=raw_lemma,
+            category=sys.intern(cat),
+            gender=sys.intern(raw_gender),
+            notes=raw_notes,
+            cefr="A1",
+            seen_in_course=False,
+            source="cefr_a1",
+        ))
+
+    kind = "YAML" if cefr_path.suffix.lower() in [".yaml", ".yml"] else "list"
     if not items:
-        raise ValueError(f"CEFR list produced 0 items. Check file format: {cefr_path}")
+        raise ValueError(f"CEFR {kind} produced 0 items. Check file format: {cefr_path}")
 
-    log.info("Loaded CEFR items: %d", len(items))
+    log.info("Loaded CEFR items%s: %d", " (YAML)" if kind == "YAML" else "", len(items))
     return items
 
 
@@ -291,12 +319,18 @@ def load_wordbank(wordbank_path: Path) -> List[Dict[str, str]]:
         raise FileNotFoundError(f"wordbank_dedup.csv not found: {wordbank_path}")
 
     rows: List[Dict[str, str]] = []
-    with wordbank_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        if not reader.fieldnames:
+    with wordbank_path.open("r", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
             raise ValueError(f"Wordbank file has no headers: {wordbank_path}")
+        n_cols = len(header)
         for row in reader:
-            rows.append({k: (v or "") for k, v in row.items()})
+            if not row:
+                continue
+            if len(row) < n_cols:
+                row += [""] * (n_cols - len(row))
+            rows.append(dict(zip(header, row)))
 
     if not rows:
         raise ValueError(f"Wordbank produced 0 rows: {wordbank_path}")
@@ -314,35 +348,30 @@ def load_conjugation_form_map(conj_tables_path: Path) -> Dict[str, str]:
         log.warning("Conjugation tables not found: %s (skipping)", conj_tables_path)
         return {}
 
-    data = yaml.safe_load(conj_tables_path.read_text(encoding="utf-8")) or {}
+    data = yaml.load(conj_tables_path.read_text(encoding="utf-8"), Loader=_Loader) or {}
     form2lemma: Dict[str, str] = {}
 
-    # Try a few likely shapes
-    # Shape A: {"tables":[{"lemma":"sein","rows":[{"form":"bin"}, ...]}]}
-    tables = data.get("tables") if isinstance(data, dict) else None
-    if isinstance(tables, list):
-        for t in tables:
-            lemma = norm_key((t or {}).get("lemma", ""))
-            rows = (t or {}).get("rows", [])
-            if not lemma or not isinstance(rows, list):
-                continue
-            for r in rows:
-                form = (r or {}).get("form") or (r or {}).get("text") or ""
-                form = norm_key(form)
-                if form:
-                    form2lemma[form] = lemma
-
-    # Shape B: list of tables directly
-    if not form2lemma and isinstance(data, list):
-        for t in data:
-            lemma = norm_key((t or {}).get("lemma", ""))
-            rows = (t or {}).get("rows", [])
-            if not lemma or not isinstance(rows, list):
-                continue
-            for r in rows:
-                form = norm_key((r or {}).get("form") or (r or {}).get("text") or "")
-                if form:
-                    form2lemma[form] = lemma
+    # Accept either shape, decided once:
+    #   Shape A: {"tables":[{"lemma":"sein","rows":[{"form":"bin"}, ...]}]}
+    #   Shape B: list of tables directly
+    if isinstance(data, dict):
+        tables = data.get("tables")
+        if not isinstance(tables, list):
+            tables = []
+    elif isinstance(data, list):
+        tables = data
+    else:
+        tables = []
+
+    for t in tables:
+        lemma = norm_key((t or {}).get("lemma", ""))
+        rows = (t or {}).get("rows", [])
+        if not lemma or not isinstance(rows, list):
+            continue
+        for r in rows:
+            form = norm_key((r or {}).get("form") or (r or {}).get("text") or "")
+            if form:
+                form2lemma[form] = lemma
 
     log.info("Loaded conjugation form→lemma entries: %d", len(form2lemma))
     return form2lemma
@@ -376,8 +405,10 @@ def enrich_wordbank_rows(
       2) conjugation tables (form2lemma) for verb_form-like tokens
       3) spaCy lemma if available
       4) fallback: norm itself
+    Rows are updated in place; the same list is returned.
+    Rows that need spaCy are collected and lemmatized in one nlp.pipe pass.
     """
-    out: List[Dict[str, str]] = []
+    spacy_rows: List[Dict[str, str]] = []
 
     for r in rows:
         token = r.get("token", "")
@@ -386,10 +417,7 @@ def enrich_wordbank_rows(
         lemma = r.get("lemma", "").strip()
 
         # normalize categories a bit
-        if cat == "det":
-            cat = "article"
-        if cat not in CANON_CATS:
-            cat = "other"
+        cat = WORDBANK_CAT_RESOLVE.get(cat, "other")
 
         # lemma: best-available logic
         if not lemma:
@@ -399,51 +427,55 @@ def enrich_wordbank_rows(
                 if cat == "other":
                     cat = "verb_form"
             elif nlp is not None:
-                doc = nlp(token)
-                if doc and len(doc) > 0:
-                    lemma = (doc[0].lemma_ or "").strip()
-                    if not cat or cat == "other":
-                        pos = doc[0].pos_
-                        # minimal POS→category
-                        pos_map = {
-                            "DET": "article",
-                            "NOUN": "noun",
-                            "PROPN": "proper noun",
-                            "VERB": "verb",
-                            "AUX": "verb",
-                            "ADJ": "adjective",
-                            "ADV": "adverb",
-                            "PRON": "pronoun",
-                            "ADP": "preposition",
-                            "CCONJ": "conjunction",
-                            "SCONJ": "conjunction",
-                            "PART": "particle",
-                            "NUM": "numeral",
-                            "INTJ": "interjection",
-                        }
-                        cat = pos_map.get(pos, cat)
+                # resolved below, in batch
+                spacy_rows.append(r)
             if not lemma:
                 lemma = norm_key(norm)
 
-        r2 = dict(r)
-        r2["norm"] = norm_key(norm)
-        r2["category"] = cat
-        r2["lemma"] = lemma
-        out.append(r2)
+        r["norm"] = norm_key(norm)
+        r["category"] = sys.intern(cat)
+        r["lemma"] = lemma
+
+    if spacy_rows:
+        # only lemma + POS are used; parser/NER are dead weight here
+        docs = nlp.pipe(
+            (r.get("token", "") for r in spacy_rows),
+            batch_size=512,
+            disable=["parser", "ner"],
+        )
+        for r, doc in zip(spacy_rows, docs):
+            if doc and len(doc) > 0:
+                lemma = (doc[0].lemma_ or "").strip()
+                if lemma:
+                    r["lemma"] = lemma
+                cat = r["category"]
+                if not cat or cat == "other":
+                    r["category"] = POS_MAP.get(doc[0].pos_, cat)
 
-    return out
+    return rows
 
 
 # -----------------------------------------------------------------------------
 # Merge logic
 # -----------------------------------------------------------------------------
+def course_example(r: Dict[str, str]) -> str:
+    # short one-line debug example; slice first so replace/strip see <= 120 chars
+    return (r.get("source_text") or r.get("token") or "")[:120].replace("\n", " ").strip()
+
+
+def sort_vocab_items(items: Iterable[VocabItem]) -> List[VocabItem]:
+    # stable sorting (category, lemma, gender), on the precomputed keys
+    return sorted(items, key=attrgetter("_ncat", "_nlemma", "_ngender"))
+
+
 def merge_cefr_with_course(
     cefr_items: List[VocabItem],
     course_rows: List[Dict[str, str]],
-) -> Dict[Tuple[str, str, str], VocabItem]:
+) -> List[VocabItem]:
     """
     CEFR items are source-of-truth. Course rows add flags + examples.
     We map course tokens to CEFR by matching lemma (primary) or norm (fallback).
+    Returns the merged entries already in output order (see sort_vocab_items).
     """
     merged: Dict[Tuple[str, str, str], VocabItem] = {}
 
@@ -454,13 +486,12 @@ def merge_cefr_with_course(
     # build quick lookup for CEFR by lemma only (category-agnostic fallback)
     cefr_by_lemma: Dict[str, List[VocabItem]] = {}
     for it in cefr_items:
-        cefr_by_lemma.setdefault(norm_key(it.lemma), []).append(it)
+        cefr_by_lemma.setdefault(it._nlemma, []).append(it)
 
     for r in course_rows:
         norm = norm_key(r.get("norm", ""))
         lemma = norm_key(r.get("lemma", "")) or norm
         cat = norm_key(r.get("category", "")) or "other"
-        example = (r.get("source_text") or r.get("token") or "")[:120].replace("\n", " ").strip()
 
         # try: match CEFR by lemma
         candidates = cefr_by_lemma.get(lemma, [])
@@ -468,7 +499,7 @@ def merge_cefr_with_course(
 
         # prefer candidate whose category matches
         for c in candidates:
-            if norm_key(c.category) == cat:
+            if c._ncat == cat:
                 chosen = c
                 break
         # else pick the first candidate if lemma matches at all
@@ -485,7 +516,7 @@ def merge_cefr_with_course(
                 notes="",
                 cefr="A1",
                 seen_in_course=True,
-                course_examples=example,
+                course_examples=course_example(r),
                 source="local_extension",
             )
             merged[chosen.key()] = chosen
@@ -493,26 +524,29 @@ def merge_cefr_with_course(
             # mark existing CEFR entry as seen
             k = chosen.key()
             merged[k].seen_in_course = True
-            if not merged[k].course_examples and example:
-                merged[k].course_examples = example
+            # only the first non-empty example is kept; build it only if needed
+            if not merged[k].course_examples:
+                merged[k].course_examples = course_example(r)
 
     log.info("Merged vocabulary entries: %d", len(merged))
-    return merged
+    # the dict is only needed for keyed updates above; sort once for the writers
+    return sort_vocab_items(merged.values())
 
 
 # -----------------------------------------------------------------------------
 # Writers
 # -----------------------------------------------------------------------------
-def write_yaml_vocab(out_yaml: Path, merged: Dict[Tuple[str, str, str], VocabItem]) -> None:
+def write_yaml_vocab(out_yaml: Path, items: List[VocabItem]) -> None:
+    """
+    items: merged entries, already in output order (see merge_cefr_with_course).
+    """
     out_yaml.parent.mkdir(parents=True, exist_ok=True)
 
-    # stable sorting
-    items = sorted(merged.values(), key=lambda x: (norm_key(x.category), norm_key(x.lemma), norm_key(x.gender)))
-
-    payload = {
-        "schema": "vocab_schema_v1",
-        "cefr_level": "A1",
-        "items": [
+    dump_vocab(
+        out_yaml,
+        schema="vocab_schema_v1",
+        cefr_level="A1",
+        items=(
             {
                 "lemma": it.lemma,
                 "category": it.category,
@@ -523,34 +557,36 @@ def write_yaml_vocab(out_yaml: Path, merged: Dict[Tuple[str, str, str], VocabIte
                 "source": it.source,
             }
             for it in items
-        ],
-    }
-
-    out_yaml.write_text(yaml.safe_dump(payload, allow_unicode=True, sort_keys=False), encoding="utf-8")
+        ),
+    )
     log.info("Wrote YAML: %s", out_yaml)
 
 
-def write_debug_csv(out_csv: Path, merged: Dict[Tuple[str, str, str], VocabItem]) -> None:
+def write_debug_csv(out_csv: Path, items: List[VocabItem]) -> None:
+    """
+    items: merged entries, already in output order (see merge_cefr_with_course).
+    """
     out_csv.parent.mkdir(parents=True, exist_ok=True)
-    items = sorted(merged.values(), key=lambda x: (norm_key(x.category), norm_key(x.lemma), norm_key(x.gender)))
 
     fieldnames = ["lemma", "category", "gender", "cefr", "seen_in_course", "source", "notes", "course_examples"]
 
     with out_csv.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for it in items:
-            row = {
-                "lemma": it.lemma,
-                "category": it.category,
-                "gender": it.gender,
-                "cefr": it.cefr,
-                "seen_in_course": "true" if it.seen_in_course else "false",
-                "source": it.source,
-                "notes": it.notes,
-                "course_examples": it.course_examples,
-            }
-            w.writerow(row)
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        # tuples in fieldnames order
+        w.writerows(
+            (
+                it.lemma,
+                it.category,
+                it.gender,
+                it.cefr,
+                "true" if it.seen_in_course else "false",
+                it.source,
+                it.notes,
+                it.course_examples,
+            )
+            for it in items
+        )
 
     log.info("Wrote debug CSV: %s", out_csv)
 
@@ -583,20 +619,21 @@ def main() -> int:
     nlp = maybe_load_spacy(args.use_spacy, args.spacy_model)
 
     wordbank_rows = enrich_wordbank_rows(wordbank_rows, form2lemma=form2lemma, nlp=nlp)
-    merged = merge_cefr_with_course(cefr_items, wordbank_rows)
+    items = merge_cefr_with_course(cefr_items, wordbank_rows)
 
-    if args.fail_on_empty and not merged:
+    if args.fail_on_empty and not items:
         raise SystemExit("Merged output is empty. Aborting because --fail-on-empty was set.")
 
-    write_yaml_vocab(out_yaml, merged)
-    write_debug_csv(out_csv, merged)
+    # already sorted; shared by both writers
+    write_yaml_vocab(out_yaml, items)
+    write_debug_csv(out_csv, items)
 
     print("\nDONE")
     print(f"  CEFR in    : {cefr_path}")
     print(f"  Wordbank in: {wordbank_path}")
     print(f"  YAML out   : {out_yaml}")
     print(f"  CSV out    : {out_csv}")
-    print(f"  Entries    : {len(merged)}")
+    print(f"  Entries    : {len(items)}")
     return 0
 
 
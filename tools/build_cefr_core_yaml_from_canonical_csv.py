@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
-import yaml
+from fast_yaml_vocab import dump_vocab
 
 
 @dataclass(frozen=True)
@@ -35,21 +35,33 @@ def load_canonical_csv(path: Path) -> List[Row]:
 
     rows: List[Row] = []
     with path.open("r", encoding="utf-8", newline="") as f:
-        r = csv.DictReader(f)
+        r = csv.reader(f)
+        header = next(r, None)
         required = {"text", "norm", "category", "lemma", "source"}
-        if not r.fieldnames or not required.issubset(set(r.fieldnames)):
+        if not header or not required.issubset(set(header)):
             raise ValueError(
-                f"CSV schema mismatch. Found: {r.fieldnames}. Required: {sorted(required)}"
+                f"CSV schema mismatch. Found: {header}. Required: {sorted(required)}"
             )
 
+        # Resolve column positions once (last duplicate wins, like DictReader)
+        col = {name: i for i, name in enumerate(header)}
+        i_text, i_norm, i_cat, i_lemma, i_src = (
+            col["text"], col["norm"], col["category"], col["lemma"], col["source"]
+        )
+        n_cols = len(header)
+
         for d in r:
+            if not d:
+                continue
+            if len(d) < n_cols:
+                d += [""] * (n_cols - len(d))
             rows.append(
                 Row(
-                    text=(d.get("text") or "").strip(),
-                    norm=(d.get("norm") or "").strip(),
-                    category=(d.get("category") or "").strip(),
-                    lemma=(d.get("lemma") or "").strip(),
-                    source=(d.get("source") or "").strip(),
+                    text=d[i_text].strip(),
+                    norm=d[i_norm].strip(),
+                    category=d[i_cat].strip(),
+                    lemma=d[i_lemma].strip(),
+                    source=d[i_src].strip(),
                 )
             )
     return rows
@@ -90,19 +102,7 @@ def build_items(rows: List[Row], default_source: str) -> List[Dict]:
 
 def write_yaml(out_path: Path, cefr_level: str, items: List[Dict]) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "schema": "vocab_schema_v1",
-        "cefr_level": cefr_level,
-        "items": items,
-    }
-    with out_path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(
-            payload,
-            f,
-            sort_keys=False,
-            allow_unicode=True,
-            width=120,
-        )
+    dump_vocab(out_path, schema="vocab_schema_v1", cefr_level=cefr_level, items=items, width=120)
 
 
 def main() -> int:
@@ -4,21 +4,29 @@ from pathlib import Path
 from typing import Dict, Tuple, Any, List
 import yaml
 
+# Prefer the LibYAML-backed C loader/dumper; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 IN_PATH = Path("linguistic_rules/morphology/conjugation_tables.yaml")
 OUT_PATH = IN_PATH  # overwrite in place (safe because git)
 
-def forms_signature(forms: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
-    # stable signature regardless of key order
-    return tuple(sorted((k, (v or "").strip()) for k, v in forms.items()))
+def forms_signature(forms: Dict[str, str]) -> str:
+    # stable signature regardless of key order; one flat string (its hash is
+    # cached) instead of a tuple of pairs rehashed on every dict lookup.
+    # \x1e / \x1f are ASCII record/unit separators, never present in forms.
+    return "\x1e".join(f"{k}\x1f{(v or '').strip()}" for k, v in sorted(forms.items()))
 
 def main() -> None:
     if not IN_PATH.exists():
         raise SystemExit(f"Missing: {IN_PATH}")
 
-    data: Dict[str, Any] = yaml.safe_load(IN_PATH.read_text(encoding="utf-8"))
+    data: Dict[str, Any] = yaml.load(IN_PATH.read_text(encoding="utf-8"), Loader=_Loader)
     tables: List[Dict[str, Any]] = data.get("tables", [])
 
-    merged: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Dict[str, Any]] = {}
+    merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
     for t in tables:
         lemma = (t.get("lemma_guess") or "").strip()
@@ -60,7 +68,8 @@ def main() -> None:
 
     # write back
     data["tables"] = deduped_tables
-    OUT_PATH.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+    with OUT_PATH.open("w", encoding="utf-8") as f:
+        yaml.dump(data, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
 
     print(f"Deduped tables: {before} -> {after}")
     print(f"Wrote: {OUT_PATH}")
@@ -2,55 +2,70 @@ from __future__ import annotations
 
 import csv
 import re
+import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Tuple, Iterable
 
 import yaml
 
+# Prefer the LibYAML-backed C dumper; fall back to pure Python.
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
 # Canonical order for output.
 # NOTE: we split sie into sie_sg and sie_pl to avoid collisions.
 PRONOUN_ORDER = ["ich", "du", "Sie", "er", "sie_sg", "es", "wir", "ihr", "sie_pl"]
 PRONOUN_SET = {"ich", "du", "Sie", "er", "sie", "es", "wir", "ihr"}  # raw pronouns we detect
+# raw pronoun -> table key (one shared string per key across all tables)
+PRONOUN_KEYS = {p: sys.intern("Sie" if p == "Sie" else p.lower()) for p in PRONOUN_SET}
+# First characters a pronoun line can start with; cheap pre-filter for the regex.
+PRONOUN_INITIALS = frozenset(p[0] for p in PRONOUN_SET)
 
 # Match: "ich spreche", "du sprichst", "Sie sprechen", "er ist", "sie sprechen"
-RE_PRONOUN_PAIR = re.compile(r"^(ich|du|er|sie|es|wir|ihr|Sie)\s+(.+?)\s*$")
+# Runs over a whole slide at once: lines are joined with LINE_SEP and each
+# match must span exactly one line (same result as matching line by line).
+LINE_SEP = "\x00"
+RE_PRONOUN_PAIR = re.compile(r"(?<![^\x00])(ich|du|er|sie|es|wir|ihr|Sie)\s+([^\n\x00]+?)\s*(?![^\x00])")
 
-IRREGULAR_MARKERS = {
-    "bin", "bist", "ist", "sind", "seid",
-    "habe", "hast", "hat", "haben",
-    "werde", "wirst", "wird", "werden"
-}
+SEIN_FORMS = {"bin", "bist", "ist", "sind", "seid"}
+HABEN_FORMS = {"habe", "hast", "hat", "haben"}
+WERDEN_FORMS = {"werde", "wirst", "wird", "werden"}
 
+IRREGULAR_MARKERS = SEIN_FORMS | HABEN_FORMS | WERDEN_FORMS
 
-def read_items_csv(path: Path) -> List[dict]:
-    with path.open(encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+UMLAUTS = frozenset("äöü")
 
 
 def normalize_pronoun(p: str) -> str:
+    # the regex only captures PRONOUN_SET spellings: hand back the shared key
+    # string instead of a fresh .lower() copy per line
+    key = PRONOUN_KEYS.get(p)
+    if key is not None:
+        return key
     return "Sie" if p == "Sie" else p.lower()
 
 
-def looks_like_pronoun_line(text: str) -> bool:
-    return bool(RE_PRONOUN_PAIR.match((text or "").strip()))
-
-
-def group_by_ppt_slide(rows: List[dict]) -> Dict[Tuple[str, str], List[str]]:
-    grouped: Dict[Tuple[str, str], List[str]] = {}
+def group_by_ppt_slide(rows: Iterable[dict]) -> Dict[Tuple[str, str], List[str]]:
+    grouped: Dict[Tuple[str, str], List[str]] = defaultdict(list)
     for r in rows:
-        ppt = r.get("ppt_file", "")
-        slide = r.get("slide_number", "")
-        t = (r.get("source_text") or r.get("token") or "").strip()
-        if not ppt or not slide or not t:
+        # cheap key checks first; only strip text for rows that can be kept
+        ppt = r.get("ppt_file")
+        slide = r.get("slide_number")
+        if not ppt or not slide:
             continue
-        grouped.setdefault((ppt, slide), []).append(t)
+        t = (r.get("source_text") or r.get("token") or "").strip()
+        if t:
+            grouped[(ppt, slide)].append(t)
     return grouped
 
 
 def extract_tables_from_group(lines: List[str]) -> List[Dict[str, str]]:
     """
-    Within a slide, find clusters of pronoun+form lines.
-    If a cluster has >= 4 unique pronouns, treat it as a conjugation table.
+    Within a slide, collect the pronoun+form lines (other lines are ignored).
+    If they cover >= 4 unique pronouns, treat them as a conjugation table.
 
     Important: "sie" may appear twice in a table (she vs they). We will store
     those as sie_sg and sie_pl based on simple heuristics.
@@ -64,12 +79,15 @@ def extract_tables_from_group(lines: List[str]) -> List[Dict[str, str]]:
             tables.append(current)
         current = {}
 
-    for line in lines:
-        m = RE_PRONOUN_PAIR.match(line.strip())
-        if not m:
-            flush()
-            continue
+    # Dispatch on the first character: only lines that can start with a
+    # pronoun reach the regex, and < 4 of them can never make a table.
+    candidates = [line for line in map(str.strip, lines) if line[:1] in PRONOUN_INITIALS]
+    if len(candidates) < 4:
+        return []
 
+    # one regex pass over the candidates instead of one match per line
+    text = LINE_SEP.join(candidates)
+    for m in RE_PRONOUN_PAIR.finditer(text):
         p_raw, form = m.group(1), m.group(2).strip()
         p = normalize_pronoun(p_raw)
 
@@ -95,11 +113,14 @@ def extract_tables_from_group(lines: List[str]) -> List[Dict[str, str]]:
 
     flush()
 
-    # Deduplicate exact tables
+    # Deduplicate exact tables (order-insensitive; keys are unique, so the
+    # item set identifies the table without sorting)
+    if len(tables) < 2:
+        return tables
     uniq: List[Dict[str, str]] = []
     seen = set()
     for t in tables:
-        key = tuple(sorted(t.items()))
+        key = frozenset(t.items())
         if key not in seen:
             seen.add(key)
             uniq.append(t)
@@ -132,13 +153,21 @@ def guess_lemma(table: Dict[str, str]) -> str:
     4) Else prefer 'ich'
     5) Else any available form
     """
-    # normalize super-common irregulars
-    forms = {(v or "").strip().lower() for v in table.values() if isinstance(v, str) and v.strip()}
-    if {"bin", "bist", "ist", "sind", "seid"} & forms:
-        return "sein"
-    if {"habe", "hast", "hat", "haben"} & forms:
+    # normalize super-common irregulars (one pass; sein > haben > werden)
+    has_haben = has_werden = False
+    for v in table.values():
+        if not isinstance(v, str):
+            continue
+        form = v.strip().lower()
+        if form in SEIN_FORMS:
+            return "sein"
+        if form in HABEN_FORMS:
+            has_haben = True
+        elif form in WERDEN_FORMS:
+            has_werden = True
+    if has_haben:
         return "haben"
-    if {"werde", "wirst", "wird", "werden"} & forms:
+    if has_werden:
         return "werden"
 
     wir = (table.get("wir") or "").strip()
@@ -169,8 +198,7 @@ def detect_pattern(table: Dict[str, str]) -> str:
     - Else if du/er stem differs from wir (compare first 4 chars) -> stem_change
     - Else regular
     """
-    forms = {v.lower() for v in table.values() if v}
-    if forms & IRREGULAR_MARKERS:
+    if any(v and v.lower() in IRREGULAR_MARKERS for v in table.values()):
         return "irregular"
 
     wir = (table.get("wir") or "").lower()
@@ -187,7 +215,7 @@ def detect_pattern(table: Dict[str, str]) -> str:
         return "stem_change"
 
     # Umlaut trigger (schlafen -> schläfst, laufen -> läufst, etc.)
-    if any(ch in (du + er) for ch in "äöü") and not any(ch in wir for ch in "äöü"):
+    if not (UMLAUTS.isdisjoint(du) and UMLAUTS.isdisjoint(er)) and UMLAUTS.isdisjoint(wir):
         return "stem_change"
 
     return "regular"
@@ -198,17 +226,15 @@ def main():
     if not items_csv.exists():
         raise SystemExit("Missing docs/ppt_extracted/items.csv — run extraction first.")
 
-    rows = read_items_csv(items_csv)
-    grouped = group_by_ppt_slide(rows)
+    # stream rows straight into the grouping; no list of all rows
+    with items_csv.open(encoding="utf-8") as f:
+        grouped = group_by_ppt_slide(csv.DictReader(f))
 
     out_tables: List[dict] = []
 
     for (ppt, slide), lines in grouped.items():
-        pronoun_lines = [ln for ln in lines if looks_like_pronoun_line(ln)]
-        if len(pronoun_lines) < 4:
-            continue
-
-        tables = extract_tables_from_group(pronoun_lines)
+        # fewer than 4 pronoun lines can never yield a table (checked inside)
+        tables = extract_tables_from_group(lines)
         for t in tables:
             lemma_guess = guess_lemma(t)
             pattern = detect_pattern(t)
@@ -233,7 +259,7 @@ def main():
     out_path = Path("linguistic_rules/morphology/conjugation_tables.yaml")
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with out_path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(payload, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(payload, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
 
     print(f"Wrote: {out_path} ({len(out_tables)} tables)")
 
@@ -5,25 +5,34 @@ import re
 import sys
 import yaml
 
+# Prefer the LibYAML-backed C loader/dumper; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
 INDEX_PATH = Path("linguistic_rules/lexicon/index.yaml")
 TABLES_PATH = Path("linguistic_rules/morphology/conjugation_tables.yaml")
+WS_RE = re.compile(r"\s+")
 
 
 def norm(s: str) -> str:
     s = (s or "").strip()
-    s = re.sub(r"\s+", " ", s)
+    # Printable with no double space means only single ASCII spaces: nothing to collapse
+    if "  " in s or not s.isprintable():
+        s = WS_RE.sub(" ", s)
     return s.lower()
 
 
 def load_yaml(p: Path):
     with p.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_Loader)
 
 
 def save_yaml(p: Path, data):
     with p.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
 
 
 def build_verb_lookup(index_data: dict) -> dict[str, str]:
@@ -75,7 +84,9 @@ def main() -> int:
         else:
             missing.append((lemma, t.get("table_id", "")))
 
-    save_yaml(TABLES_PATH, tables_data)
+    # Nothing linked -> leave the tables file (and its mtime) untouched
+    if updated:
+        save_yaml(TABLES_PATH, tables_data)
 
     print(f"Updated tables with lemma_lex_id: {updated}")
     if missing:
@@ -22,8 +22,9 @@ import argparse
 import csv
 import re
 import unicodedata as ud
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import spacy
 from pptx import Presentation
@@ -38,6 +39,20 @@ from pptx import Presentation
 #   python -m spacy download de_core_news_sm
 DEFAULT_SPACY_MODEL = "de_core_news_lg"
 
+# Only tagger/morphologizer/lemmatizer output (pos_, lemma_) is used;
+# the dependency parser and NER are skipped at load time.
+SPACY_DISABLE = ["parser", "ner"]
+SPACY_BATCH_SIZE = 256
+
+
+@lru_cache(maxsize=4)
+def get_nlp(model_name: str):
+    """
+    Load a spaCy model once per process (keyed by name), unused pipes disabled.
+    Lets callers that import this module reuse the model across decks.
+    """
+    return spacy.load(model_name, disable=SPACY_DISABLE)
+
 
 # =============================================================================
 # Robust classroom German overrides
@@ -141,15 +156,69 @@ MIXED_VERBS = {
     "senden", "wenden", "wissen"
 }
 
+# One anchored alternation for get_base_verb: separable prefixes before
+# inseparable ones, longest first within each group ("zusammen" before "zu");
+# the lookahead requires at least 3 characters after the prefix.
+VERB_PREFIX_RE = re.compile(
+    "^(" + "|".join(
+        re.escape(p)
+        for group in (SEPARABLE_PREFIXES, INSEPARABLE_PREFIXES)
+        for p in sorted(group, key=lambda p: (-len(p), p))
+    ) + ")(?=.{3})",
+    re.DOTALL,
+)
+
+# Verb list membership as bit flags: classify_verb ORs the flags of base and
+# lemma (two dict lookups) and reads the verb type from a precomputed table.
+VERB_MODAL, VERB_HIGHLY_IRREGULAR, VERB_MIXED, VERB_IRREGULAR, VERB_STEM_CHANGING = 1, 2, 4, 8, 16
+
+
+def _build_verb_flags() -> Dict[str, int]:
+    flags: Dict[str, int] = {}
+    for flag, verbs in (
+        (VERB_MODAL, MODAL_VERBS),
+        (VERB_HIGHLY_IRREGULAR, HIGHLY_IRREGULAR_VERBS),
+        (VERB_MIXED, MIXED_VERBS),
+        (VERB_IRREGULAR, IRREGULAR_VERBS),
+        (VERB_STEM_CHANGING, STEM_CHANGING_VERBS),
+    ):
+        for v in verbs:
+            flags[v] = flags.get(v, 0) | flag
+    return flags
+
+
+def _verb_type_for_flags(flags: int) -> str:
+    # priority: modal > highly irregular > mixed > irregular > stem-changing
+    if flags & VERB_MODAL:
+        return "modal verb"
+    if flags & VERB_HIGHLY_IRREGULAR:
+        return "highly irregular verb"
+    if flags & VERB_MIXED:
+        return "mixed verb"
+    if flags & VERB_IRREGULAR:
+        if flags & VERB_STEM_CHANGING:
+            return "irregular stem-changing verb"
+        return "irregular verb"
+    if flags & VERB_STEM_CHANGING:
+        return "stem-changing verb"
+    return "regular verb"
+
+
+VERB_FLAGS = _build_verb_flags()
+VERB_TYPE_BY_FLAGS = [_verb_type_for_flags(f) for f in range(32)]
+
 
 # =============================================================================
 # Normalization helpers
 # =============================================================================
 WORDISH_RE = re.compile(r"^[A-Za-zÄÖÜäöüß]+(?:-[A-Za-zÄÖÜäöüß]+)*$")
 
+@lru_cache(maxsize=65536)
 def nfc_lower(s: str) -> str:
+    # tokens/lemmas repeat heavily across slides; called several times per token
     return ud.normalize("NFC", s).strip().lower()
 
+@lru_cache(maxsize=65536)
 def is_vocab_token(text: str) -> bool:
     """
     Filter out junk:
@@ -159,18 +228,15 @@ def is_vocab_token(text: str) -> bool:
     - tokens that are not "wordish" (German letters/hyphen)
     """
     t = nfc_lower(text)
-    if not t:
-        return False
-    if t.isdigit():
-        return False
-    return bool(WORDISH_RE.match(t))
+    # WORDISH_RE also rejects empty strings and digits, so one match decides
+    return WORDISH_RE.match(t) is not None
 
 
 # =============================================================================
 # Classroom meta / slide-instruction tokens to exclude
 # =============================================================================
 # These are not German vocab words; they come from grammar explanation slides.
-META_TOKENS = {
+META_TOKENS = frozenset({
     "infinitive", "conjugated", "conjugation",
     "direct", "object",
     "definite", "indefinite",
@@ -179,11 +245,16 @@ META_TOKENS = {
     "article", "articles",
     "pronoun", "preposition",
     "adjective", "adverb",
-}
+})
 
-def is_meta_token_text(t_norm: str) -> bool:
-    # Keep it simple and ruthless: if it’s one of these, it’s not vocab.
-    return t_norm in META_TOKENS
+def is_meta_only_text(text: str) -> bool:
+    """
+    True if every whitespace-separated word of a slide is a meta token
+    (e.g. "Plural Singular"). Such a slide cannot yield a row, so it can
+    skip spaCy entirely. Anything with punctuation attached is left to spaCy.
+    """
+    words = text.split()
+    return bool(words) and all(nfc_lower(w) in META_TOKENS for w in words)
 
 
 # =============================================================================
@@ -192,33 +263,18 @@ def is_meta_token_text(t_norm: str) -> bool:
 def get_base_verb(lemma: str) -> Tuple[str, Optional[str], Optional[bool]]:
     """Return (base_verb, prefix, is_separable) if a prefix is detected."""
     lemma = nfc_lower(lemma)
-    for prefix in SEPARABLE_PREFIXES:
-        if lemma.startswith(prefix) and len(lemma) > len(prefix) + 2:
-            return lemma[len(prefix):], prefix, True
-    for prefix in INSEPARABLE_PREFIXES:
-        if lemma.startswith(prefix) and len(lemma) > len(prefix) + 2:
-            return lemma[len(prefix):], prefix, False
+    m = VERB_PREFIX_RE.match(lemma)
+    if m:
+        prefix = m.group(1)
+        return lemma[len(prefix):], prefix, prefix in SEPARABLE_PREFIXES
     return lemma, None, None
 
+@lru_cache(maxsize=8192)
 def classify_verb(lemma: str) -> str:
     lemma = nfc_lower(lemma)
     base, prefix, is_sep = get_base_verb(lemma)
 
-    if base in MODAL_VERBS or lemma in MODAL_VERBS:
-        verb_type = "modal verb"
-    elif base in HIGHLY_IRREGULAR_VERBS or lemma in HIGHLY_IRREGULAR_VERBS:
-        verb_type = "highly irregular verb"
-    elif base in MIXED_VERBS or lemma in MIXED_VERBS:
-        verb_type = "mixed verb"
-    elif base in IRREGULAR_VERBS or lemma in IRREGULAR_VERBS:
-        if base in STEM_CHANGING_VERBS or lemma in STEM_CHANGING_VERBS:
-            verb_type = "irregular stem-changing verb"
-        else:
-            verb_type = "irregular verb"
-    elif base in STEM_CHANGING_VERBS or lemma in STEM_CHANGING_VERBS:
-        verb_type = "stem-changing verb"
-    else:
-        verb_type = "regular verb"
+    verb_type = VERB_TYPE_BY_FLAGS[VERB_FLAGS.get(base, 0) | VERB_FLAGS.get(lemma, 0)]
 
     if prefix:
         if is_sep:
@@ -230,12 +286,15 @@ def classify_verb(lemma: str) -> str:
 # =============================================================================
 # Category mapping: spaCy -> repo buckets
 # =============================================================================
-def get_internal_category(token) -> str:
+def get_internal_category(token, t: Optional[str] = None, lem: Optional[str] = None) -> str:
     """
     Internal categories (fine-grained) then mapped down to repo categories.
+    t / lem: nfc_lower'd token text / lemma, if the caller already has them.
     """
-    t = nfc_lower(token.text)
-    lem = nfc_lower(token.lemma_)
+    if t is None:
+        t = nfc_lower(token.text)
+    if lem is None:
+        lem = nfc_lower(token.lemma_)
 
     # HARD OVERRIDES FIRST (prevents stupid mistakes like kein=verb)
     if t in NEG_DETERMINERS:
@@ -318,36 +377,54 @@ def map_internal_to_repo_category(internal_cat: str) -> str:
     return "unknown"
 
 
+@lru_cache(maxsize=None)
+def internal_category_info(internal_cat: str) -> Tuple[bool, str]:
+    """
+    (is_verbish, repo_category) for an internal category. The set of internal
+    categories is small and closed (fixed labels + verb type/prefix strings),
+    so this is computed once per label instead of once per token.
+    """
+    return "verb" in internal_cat, map_internal_to_repo_category(internal_cat)
+
+
 # =============================================================================
 # PPTX extraction
 # =============================================================================
-def iter_slide_texts(pptx_path: Path) -> List[Tuple[int, str]]:
+def iter_slide_texts(pptx_path: Path) -> Iterator[Tuple[int, str]]:
     prs = Presentation(str(pptx_path))
-    out: List[Tuple[int, str]] = []
 
     for slide_num, slide in enumerate(prs.slides, 1):
         chunks: List[str] = []
         for shape in slide.shapes:
             if hasattr(shape, "text") and shape.text:
                 chunks.append(shape.text)
-        txt = " ".join(chunks)
-        out.append((slide_num, txt))
-    return out
+        yield slide_num, " ".join(chunks)
 
 
-def extract_vocab_rows(nlp, pptx_path: Path) -> List[dict]:
-    ppt_name = pptx_path.name
-    rows: List[dict] = []
-
-    slide_texts = iter_slide_texts(pptx_path)
+class ItemRow(NamedTuple):
+    """One items.csv row; a plain tuple, so csv.writer takes it as-is."""
+    ppt_file: str
+    slide_number: int
+    norm_text: str
+    category: str
 
-    for slide_num, full_text in slide_texts:
-        if not full_text.strip():
-            continue
 
-        doc = nlp(full_text)
+def extract_vocab_rows(nlp, pptx_path: Path, n_process: int = 1) -> Iterator[ItemRow]:
+    """
+    Yield items.csv rows as slides are processed (see write_items_csv).
+    n_process > 1 lets spaCy tag slide batches in worker processes.
+    """
+    ppt_name = pptx_path.name
 
-        prev_token = None  # for article+noun combos
+    # one batched nlp.pipe pass over all slides that can yield vocab
+    # (slide number rides along)
+    slides = (
+        (full_text, slide_num)
+        for slide_num, full_text in iter_slide_texts(pptx_path)
+        if full_text.strip() and not is_meta_only_text(full_text)
+    )
+    for doc, slide_num in nlp.pipe(slides, as_tuples=True, batch_size=SPACY_BATCH_SIZE, n_process=n_process):
+        prev_norm = None  # for article+noun combos
         prev_internal = None
 
         for tok in doc:
@@ -355,70 +432,61 @@ def extract_vocab_rows(nlp, pptx_path: Path) -> List[dict]:
                 continue
 
             raw = tok.text
-            if not is_vocab_token(raw):
-                prev_token = None
-                prev_internal = None
-                continue
-
             t_norm = nfc_lower(raw)
-            if is_meta_token_text(t_norm):
-                # This is the main fix for your grep “infinitive” pollution.
-                prev_token = None
+            # Junk and meta tokens are dropped the same way, so test the cheap
+            # set lookup before the regex.
+            # Meta: this is the main fix for your grep “infinitive” pollution.
+            if t_norm in META_TOKENS or not is_vocab_token(raw):
+                prev_norm = None
                 prev_internal = None
                 continue
 
             lem_norm = nfc_lower(tok.lemma_)
-            internal_cat = get_internal_category(tok)
+            # normalize once per token; reused for categorization and the combo
+            internal_cat = get_internal_category(tok, t_norm, lem_norm)
 
             # Decide what we store as norm_text:
             # - verbs: store infinitive lemma
             # - others: store normalized token text
-            is_verbish = "verb" in internal_cat
+            is_verbish, repo_cat = internal_category_info(internal_cat)
             store_text = lem_norm if is_verbish else t_norm
 
             # Also protect against meta tokens showing up as lemmas
-            if is_meta_token_text(store_text):
-                prev_token = None
+            # (t_norm already passed the meta check; only a verb lemma can differ)
+            if is_verbish and lem_norm in META_TOKENS:
+                prev_norm = None
                 prev_internal = None
                 continue
 
-            repo_cat = map_internal_to_repo_category(internal_cat)
-
             # Emit token itself
-            rows.append({
-                "ppt_file": ppt_name,
-                "slide_number": slide_num,
-                "norm_text": store_text,
-                "category": repo_cat,
-            })
+            yield ItemRow(ppt_name, slide_num, store_text, repo_cat)
 
             # Emit article+noun combo (extra vocab entry)
             # Only when we see article/determiner_negation followed immediately by noun/proper noun.
-            if prev_token is not None and prev_internal in {"article", "determiner_negation"}:
+            if prev_norm is not None and prev_internal in {"article", "determiner_negation"}:
                 if internal_cat in {"noun", "proper_noun"}:
-                    combo = f"{nfc_lower(prev_token.text)} {t_norm}"
-                    if not is_meta_token_text(combo):
-                        rows.append({
-                            "ppt_file": ppt_name,
-                            "slide_number": slide_num,
-                            "norm_text": combo,
-                            "category": "noun",
-                        })
-
-            prev_token = tok
-            prev_internal = internal_cat
+                    combo = f"{prev_norm} {t_norm}"
+                    if combo not in META_TOKENS:
+                        yield ItemRow(ppt_name, slide_num, combo, "noun")
 
-    return rows
+            prev_norm = t_norm
+            prev_internal = internal_cat
 
 
-def write_items_csv(rows: List[dict], out_csv: Path) -> None:
+def write_items_csv(rows: Iterable[ItemRow], out_csv: Path) -> int:
+    """
+    Write rows as they arrive (rows may be a generator); returns the row count.
+    """
     out_csv.parent.mkdir(parents=True, exist_ok=True)
 
-    with out_csv.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=["ppt_file", "slide_number", "norm_text", "category"])
-        w.writeheader()
+    n = 0
+    with out_csv.open("w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(ItemRow._fields)
         for r in rows:
             w.writerow(r)
+            n += 1
+    return n
 
 
 # =============================================================================
@@ -429,6 +497,7 @@ def main():
     ap.add_argument("--pptx", required=True, help="Path to master PPTX file (all slides merged).")
     ap.add_argument("--out", default="docs/ppt_extracted/items.csv", help="Output items.csv path.")
     ap.add_argument("--model", default=DEFAULT_SPACY_MODEL, help="spaCy German model name.")
+    ap.add_argument("--n-process", type=int, default=1, help="spaCy worker processes (-1 = all CPUs).")
     args = ap.parse_args()
 
     pptx_path = Path(args.pptx)
@@ -438,7 +507,7 @@ def main():
     out_csv = Path(args.out)
 
     try:
-        nlp = spacy.load(args.model)
+        nlp = get_nlp(args.model)
     except OSError as e:
         raise SystemExit(
             f"ERROR: spaCy model '{args.model}' not found.\n"
@@ -448,10 +517,10 @@ def main():
         ) from e
 
     print("Parsing PowerPoint presentation...")
-    rows = extract_vocab_rows(nlp, pptx_path)
+    # extraction and writing run as one pass; no list of all rows is kept
+    n_rows = write_items_csv(extract_vocab_rows(nlp, pptx_path, n_process=args.n_process), out_csv)
 
-    print(f"Extracted {len(rows)} vocab rows (includes article+noun combos).")
-    write_items_csv(rows, out_csv)
+    print(f"Extracted {n_rows} vocab rows (includes article+noun combos).")
     print(f"Wrote: {out_csv}")
 
     print("\nNext steps (repo pipeline):")
@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from pptx import Presentation
 
@@ -18,9 +19,17 @@ def extract_text(ppt_path: Path) -> list[str]:
     return lines
 
 def main():
+    ppts = sorted(PPT_DIR.glob("*.pptx"))
+    # decks are independent; parse them in worker processes (map keeps order)
+    if len(ppts) > 1:
+        with ProcessPoolExecutor() as ex:
+            per_deck = list(ex.map(extract_text, ppts))
+    else:
+        per_deck = [extract_text(ppt) for ppt in ppts]
+
     all_lines = []
-    for ppt in sorted(PPT_DIR.glob("*.pptx")):
-        all_lines.extend(extract_text(ppt))
+    for lines in per_deck:
+        all_lines.extend(lines)
         all_lines.append("\n---\n")
     OUT.write_text("\n".join(all_lines), encoding="utf-8")
     print(f"Wrote: {OUT}")
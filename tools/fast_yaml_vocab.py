@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Schema-specific YAML writer for vocab_schema_v1 payloads.
+
+vocab_schema_v1 is a fixed, flat shape:
+
+  schema: vocab_schema_v1
+  cefr_level: A1
+  items:
+  - lemma: ...
+    category: ...
+    seen_in_course: false
+    ...
+
+Items whose values are all simple plain scalars (the vast majority) are written
+as literal lines; anything that PyYAML would quote, fold, or tag gets the item
+handed to yaml.dump instead. Output is byte-identical to
+yaml.dump(payload, sort_keys=False, allow_unicode=True, width=width).
+
+Used by:
+  - tools/build_cefr_a1_vocab.py
+  - tools/build_cefr_core_yaml_from_canonical_csv.py
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+from yaml.resolver import Resolver
+
+# Prefer the LibYAML-backed C dumper; fall back to pure Python.
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+# Conservative "always plain" shape: starts with a word char, no YAML
+# indicators (:, #, [, {, ...), no leading/trailing space.
+_PLAIN_RE = re.compile(r"\w(?:[\w .\-'/()]*[\w.\-'/()])?")
+
+# first char -> [(tag, regexp)] for bool/int/float/null/timestamp/...
+_IMPLICIT = Resolver.yaml_implicit_resolvers
+
+
+@lru_cache(maxsize=65536)
+def _plain(value: str) -> bool:
+    # Must look like a plain scalar AND not resolve to bool/int/float/null/...
+    if _PLAIN_RE.fullmatch(value) is None:
+        return False
+    # libyaml escapes code points above U+FFFF, pure PyYAML does not; leave
+    # those to whichever dumper is in use
+    if max(value) > "\uffff":
+        return False
+    for _tag, regexp in _IMPLICIT.get(value[0], []) + _IMPLICIT.get(None, []):
+        if regexp.match(value):
+            return False
+    return True
+
+
+def _fast_item_lines(item: Dict[str, Any], width: int) -> Optional[str]:
+    """
+    Return the literal YAML for one sequence item, or None if any value
+    needs PyYAML's own quoting/folding rules.
+    """
+    parts = []
+    for key, value in item.items():
+        if value is True:
+            text = "true"
+        elif value is False:
+            text = "false"
+        elif isinstance(value, str):
+            if not value:
+                text = "''"
+            elif _plain(value):
+                text = value
+                # PyYAML only folds plain scalars at spaces past `width`
+                if " " in value and 2 + len(key) + 2 + len(value) > width:
+                    return None
+            else:
+                return None
+        else:
+            return None
+        if not _plain(key):
+            return None
+        parts.append(f"  {key}: {text}\n")
+    if not parts:
+        return None
+    return "- " + "".join(parts)[2:]
+
+
+def dump_vocab(
+    path: Path,
+    schema: str,
+    cefr_level: str,
+    items: Iterable[Dict[str, Any]],
+    width: int = 80,
+) -> None:
+    """
+    Write a vocab_schema_v1 payload ({schema, cefr_level, items}) to path.
+    """
+    header = {"schema": schema, "cefr_level": cefr_level}
+    with path.open("w", encoding="utf-8") as f:
+        yaml.dump(header, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True, width=width)
+
+        # Consecutive items that need PyYAML are dumped together (fewer calls)
+        pending: List[Dict[str, Any]] = []
+
+        def flush() -> None:
+            if pending:
+                yaml.dump(pending, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True, width=width)
+                pending.clear()
+
+        wrote_any = False
+        for item in items:
+            if not wrote_any:
+                f.write("items:\n")
+                wrote_any = True
+            text = _fast_item_lines(item, width)
+            if text is None:
+                pending.append(item)
+            else:
+                flush()
+                f.write(text)
+        flush()
+        if not wrote_any:
+            f.write("items: []\n")
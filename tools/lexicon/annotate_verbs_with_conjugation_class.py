@@ -17,16 +17,22 @@ import argparse
 from pathlib import Path
 import yaml
 
+# Prefer the LibYAML-backed C loader/dumper; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
 def load_yaml(path: Path):
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_Loader) or {}
 
 
 def dump_yaml(data, path: Path):
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
 
 
 def extract_sample_lemmas(grammar_yaml: dict) -> set[str]:
@@ -64,6 +70,10 @@ def main() -> int:
     irregular_set = extract_sample_lemmas(irregular_data)
     stem_set = extract_sample_lemmas(stem_data)
 
+    # lemma -> class in one lookup; irregular wins over stemchange
+    class_by_lemma = {lemma: "stemchange" for lemma in stem_set}
+    class_by_lemma.update({lemma: "irregular" for lemma in irregular_set})
+
     updated = 0
     kept = 0
 
@@ -78,12 +88,7 @@ def main() -> int:
             kept += 1
             continue
 
-        if lemma in irregular_set:
-            it["conjugation_class"] = "irregular"
-        elif lemma in stem_set:
-            it["conjugation_class"] = "stemchange"
-        else:
-            it["conjugation_class"] = "regular"
+        it["conjugation_class"] = class_by_lemma.get(lemma, "regular")
 
         updated += 1
 
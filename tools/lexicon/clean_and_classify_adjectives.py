@@ -18,12 +18,19 @@ from __future__ import annotations
 import re
 import unicodedata as ud
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date
 from pathlib import Path
 from typing import Dict, List, Tuple
 
 import yaml
 
+# Prefer the LibYAML-backed C loader/dumper; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
 # ----------------------------
 # Config
@@ -64,6 +71,7 @@ TRANSLATIONS: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=8192)
 def nfc_lower(s: str) -> str:
     return ud.normalize("NFC", (s or "")).strip().lower()
 
@@ -86,7 +94,7 @@ def generate_item_id(index: int) -> str:
 
 
 def clean_and_rewrite_adjectives(input_path: Path, output_path: Path) -> None:
-    data = yaml.safe_load(input_path.read_text(encoding="utf-8")) or {}
+    data = yaml.load(input_path.read_text(encoding="utf-8"), Loader=_Loader) or {}
 
     cleaned_items: List[dict] = []
     removed_items: List[Tuple[str, str]] = []
@@ -146,7 +154,7 @@ def clean_and_rewrite_adjectives(input_path: Path, output_path: Path) -> None:
     }
 
     output_path.write_text(
-        yaml.dump(output_data, allow_unicode=True, sort_keys=False),
+        yaml.dump(output_data, Dumper=_Dumper, allow_unicode=True, sort_keys=False),
         encoding="utf-8"
     )
 
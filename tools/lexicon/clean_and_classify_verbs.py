@@ -12,10 +12,23 @@ Author: Wortschatzspiel Project
 Date: 2026-01-12
 """
 
+import argparse
+import sys
 import yaml
 import re
 from pathlib import Path
 from datetime import date
+from functools import lru_cache
+
+# Prefer the LibYAML-backed C loader; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# tools/ holds the shared yaml_items writer
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from yaml_items import dump_items_yaml  # noqa: E402
 
 # === LINGUISTIC CLASSIFICATION DATA ===
 
@@ -270,27 +283,49 @@ TRANSLATIONS = {
 }
 
 
+def _build_verb_classes() -> dict:
+    """Flatten the class sets into {lemma: class}; earlier sets take priority."""
+    classes = {}
+    for verb_class, verbs in (
+        ('modal', MODAL_VERBS),
+        ('irregular', IRREGULAR_VERBS),
+        ('stem_change_a_ae', STEM_CHANGE_A_AE),
+        ('stem_change_e_i', STEM_CHANGE_E_I),
+        ('stem_change_e_ie', STEM_CHANGE_E_IE),
+        ('strong', STRONG_VERBS),
+    ):
+        for v in verbs:
+            classes.setdefault(v, verb_class)
+    return classes
+
+
+VERB_CLASSES = _build_verb_classes()
+
+# Separable/compound prefixes, longest first so "zurück" wins over "zu"
+VERB_PREFIXES = tuple(sorted(
+    ['ab', 'an', 'auf', 'aus', 'bei', 'ein', 'mit', 'nach',
+     'vor', 'zu', 'zurück', 'weg', 'hin', 'her', 'los', 'fest',
+     'weiter', 'über', 'unter', 'um', 'durch', 'wieder'],
+    key=len, reverse=True,
+))
+
+# First letter -> candidate prefixes (still longest first), so a lemma is
+# only checked against the two or three prefixes it could start with
+VERB_PREFIXES_BY_INITIAL = {
+    initial: tuple(p for p in VERB_PREFIXES if p[0] == initial)
+    for initial in {p[0] for p in VERB_PREFIXES}
+}
+
+
+@lru_cache(maxsize=None)
 def classify_verb(lemma: str) -> str:
     """Assign correct conjugation class based on linguistic rules."""
-    if lemma in MODAL_VERBS:
-        return 'modal'
-    if lemma in IRREGULAR_VERBS:
-        return 'irregular'
-    if lemma in STEM_CHANGE_A_AE:
-        return 'stem_change_a_ae'
-    if lemma in STEM_CHANGE_E_I:
-        return 'stem_change_e_i'
-    if lemma in STEM_CHANGE_E_IE:
-        return 'stem_change_e_ie'
-    if lemma in STRONG_VERBS:
-        return 'strong'
+    verb_class = VERB_CLASSES.get(lemma)
+    if verb_class:
+        return verb_class
     
     # Check for compound verbs (separable prefix + known stem)
-    prefixes = ['ab', 'an', 'auf', 'aus', 'bei', 'ein', 'mit', 'nach', 
-                'vor', 'zu', 'zurück', 'weg', 'hin', 'her', 'los', 'fest',
-                'weiter', 'über', 'unter', 'um', 'durch', 'wieder']
-    
-    for prefix in sorted(prefixes, key=len, reverse=True):
+    for prefix in VERB_PREFIXES_BY_INITIAL.get(lemma[:1], ()):
         if lemma.startswith(prefix) and len(lemma) > len(prefix) + 2:
             stem = lemma[len(prefix):]
             stem_class = classify_verb(stem)
@@ -300,13 +335,20 @@ def classify_verb(lemma: str) -> str:
     return 'regular'
 
 
+# German infinitives typically end in -en, -ern, or -eln
+INFINITIVE_SUFFIXES = ('en', 'ern', 'eln')
+INFINITIVE_CHARS_RE = re.compile(r'^[a-zäöüß]+$')
+
+
 def is_valid_infinitive(lemma: str) -> bool:
-    """Check if entry appears to be a valid German infinitive."""
+    """
+    Check if entry appears to be a valid German infinitive.
+    Expects the stripped, lowercased lemma from the main loop.
+    """
     if lemma in INVALID_ENTRIES:
         return False
     
-    # German infinitives typically end in -en, -ern, or -eln
-    if not (lemma.endswith('en') or lemma.endswith('ern') or lemma.endswith('eln')):
+    if not lemma.endswith(INFINITIVE_SUFFIXES):
         return False
     
     # Reject very short entries
@@ -314,7 +356,7 @@ def is_valid_infinitive(lemma: str) -> bool:
         return False
     
     # Reject entries with unusual characters
-    if not re.match(r'^[a-zäöüß]+$', lemma.lower()):
+    if not INFINITIVE_CHARS_RE.match(lemma):
         return False
     
     return True
@@ -325,11 +367,11 @@ def generate_item_id(index: int) -> str:
     return f"A1-V-{index:04d}"
 
 
-def clean_and_classify_verbs(input_path: str, output_path: str):
+def clean_and_classify_verbs(input_path: str, output_path: str, report_file: str = None):
     """Main processing function."""
     
     with open(input_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
     
     cleaned_items = []
     removed_items = []
@@ -400,64 +442,74 @@ def clean_and_classify_verbs(input_path: str, output_path: str):
         cleaned_items.append(new_item)
         item_index += 1
     
-    # Build output structure
-    output_data = {
+    # Build output header (items are streamed after it)
+    header = {
         'schema': 'lexical_schema_v1',
         'language': 'de',
         'cefr_level': 'A1',
         'source': 'cefr_a1_core',
         'last_updated': str(date.today()),
-        'items': cleaned_items
     }
     
     # Write output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        yaml.dump(output_data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    dump_items_yaml(output_path, header, cleaned_items, allow_unicode=True, default_flow_style=False, sort_keys=False)
     
-        # Generate report
-    print("\n" + "=" * 60)
-    print("VERB LEXICON CLEANUP REPORT")
-    print("=" * 60)
-    print(f"Input file:  {input_path}")
-    print(f"Output file: {output_path}")
-    print("-" * 60)
-    print(f"Input items:    {len(data.get('items', []))}")
-    print(f"Output items:   {len(cleaned_items)}")
-    print(f"Removed:        {len(removed_items)}")
-    print(f"Corrected:      {len(corrected_items)}")
-    print("-" * 60)
+    # Generate report (collected and written once)
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("VERB LEXICON CLEANUP REPORT")
+    lines.append("=" * 60)
+    lines.append(f"Input file:  {input_path}")
+    lines.append(f"Output file: {output_path}")
+    lines.append("-" * 60)
+    lines.append(f"Input items:    {len(data.get('items', []))}")
+    lines.append(f"Output items:   {len(cleaned_items)}")
+    lines.append(f"Removed:        {len(removed_items)}")
+    lines.append(f"Corrected:      {len(corrected_items)}")
+    lines.append("-" * 60)
     
-    print("\nCLASSIFICATION DISTRIBUTION:")
+    lines.append("\nCLASSIFICATION DISTRIBUTION:")
     for verb_class, count in sorted(class_counts.items()):
         if count > 0:
-            print(f"  {verb_class}: {count}")
+            lines.append(f"  {verb_class}: {count}")
     
-    print(f"\nMISSING TRANSLATIONS: {len(missing_translations)}")
+    lines.append(f"\nMISSING TRANSLATIONS: {len(missing_translations)}")
     if missing_translations and len(missing_translations) <= 20:
         for lemma in missing_translations:
-            print(f"  - {lemma}")
+            lines.append(f"  - {lemma}")
     elif missing_translations:
-        print(f"  (First 20 shown)")
+        lines.append("  (First 20 shown)")
         for lemma in missing_translations[:20]:
-            print(f"  - {lemma}")
+            lines.append(f"  - {lemma}")
     
     if removed_items:
-        print("\nREMOVED ENTRIES:")
+        lines.append("\nREMOVED ENTRIES:")
         for lemma, reason in removed_items:
-            print(f"  - {lemma} ({reason})")
+            lines.append(f"  - {lemma} ({reason})")
     
     if corrected_items:
-        print("\nCORRECTED ENTRIES:")
+        lines.append("\nCORRECTED ENTRIES:")
         for old, new in corrected_items:
-            print(f"  - {old} → {new}")
+            lines.append(f"  - {old} → {new}")
+    
+    lines.append("\n" + "=" * 60)
+    lines.append("CLEANUP COMPLETE")
+    lines.append("=" * 60)
     
-    print("\n" + "=" * 60)
-    print("CLEANUP COMPLETE")
-    print("=" * 60)
+    report = '\n'.join(lines) + '\n'
+    if report_file:
+        Path(report_file).write_text(report, encoding='utf-8')
+        print(f"Report written to {report_file}")
+    else:
+        sys.stdout.write(report)
 
 
 def main():
     """Entry point."""
+    ap = argparse.ArgumentParser(description="Clean and classify the verb lexicon.")
+    ap.add_argument("--report-file", help="Write the cleanup report here instead of stdout")
+    args = ap.parse_args()
+    
     input_path = Path("linguistic_rules/lexicon/verbs.yaml")
     output_path = Path("linguistic_rules/lexicon/verbs_cleaned.yaml")
     
@@ -465,7 +517,7 @@ def main():
         print(f"ERROR: Input file not found: {input_path}")
         return
     
-    clean_and_classify_verbs(str(input_path), str(output_path))
+    clean_and_classify_verbs(str(input_path), str(output_path), args.report_file)
     
     print(f"\nNext steps:")
     print(f"  1. Review {output_path}")
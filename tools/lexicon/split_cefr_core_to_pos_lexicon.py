@@ -21,11 +21,22 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
 
+# Prefer the LibYAML-backed C loader; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# tools/ holds the shared yaml_items writer
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from yaml_items import dump_items_yaml  # noqa: E402
+
 
 POS_MAP = {
     "noun": "nouns.yaml",
@@ -45,20 +56,16 @@ DEFAULT_OUT_FILES = [
 
 def load_yaml(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_Loader) or {}
+
 
+# Keep it human-readable and consistent
+DUMP_KW = dict(sort_keys=False, allow_unicode=True, width=1000)
 
-def dump_yaml(data: Dict[str, Any], path: Path) -> None:
+
+def dump_yaml(header: Dict[str, Any], items: List[Dict[str, Any]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        # Keep it human-readable and consistent
-        yaml.safe_dump(
-            data,
-            f,
-            sort_keys=False,
-            allow_unicode=True,
-            width=1000,
-        )
+    dump_items_yaml(path, header, items, **DUMP_KW)
 
 
 def normalize_category(cat: str) -> str:
@@ -116,11 +123,13 @@ def main() -> int:
 
         out_file = POS_MAP.get(cat, "others.yaml")
 
-        # Copy item + enforce source marker for traceability
-        new_item = dict(it)
-        new_item["lemma"] = lemma
-        new_item["category"] = cat if cat else "other"
-        new_item["source"] = "cefr_a1_core"
+        # Copy item + enforce source marker for traceability (one merge)
+        new_item = {
+            **it,
+            "lemma": lemma,
+            "category": cat if cat else "other",
+            "source": "cefr_a1_core",
+        }
 
         buckets[out_file].append(new_item)
         written += 1
@@ -136,14 +145,13 @@ def main() -> int:
             print(f"SKIP (exists): {out_path}  (use --overwrite to replace)")
             continue
 
-        out_data = {
+        header = {
             "schema": "lexical_schema_v1",
             "language": "de",
             "cefr_level": args.cefr_level,
             "source": "cefr_a1_core",
-            "items": bucket_items,
         }
-        dump_yaml(out_data, out_path)
+        dump_yaml(header, bucket_items, out_path)
         print(f"WROTE: {out_path}  ({len(bucket_items)} items)")
 
     print(f"\nDONE. Total items routed: {written}")
@@ -14,6 +14,12 @@ import yaml
 from collections import Counter
 from pathlib import Path
 
+# Prefer the LibYAML-backed C loader; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 VOCAB_YAML = Path("linguistic_rules/vocab/cefr_a1.yaml")
 
 
@@ -22,15 +28,16 @@ def main() -> None:
         raise FileNotFoundError(f"Missing vocab file: {VOCAB_YAML}")
 
     with VOCAB_YAML.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_Loader) or {}
 
     items = data.get("items", [])
     if not items:
         print("No vocab items found.")
         return
 
-    lemmas = []
-    pos_types = []
+    # Single pass: count straight into the set/Counter, no intermediate lists
+    lemmas = set()
+    pos_counts = Counter()
 
     for item in items:
         # Headword (lemma)
@@ -41,12 +48,11 @@ def main() -> None:
         pos = (item.get("type") or "").strip().lower()
 
         if lemma:
-            lemmas.append(lemma)
+            lemmas.add(lemma)
         if pos:
-            pos_types.append(pos)
+            pos_counts[pos] += 1
 
-    unique_lemmas = len(set(lemmas))
-    pos_counts = Counter(pos_types)
+    unique_lemmas = len(lemmas)
 
     core_pos = {"noun", "verb", "adjective"}
     function_words = sum(
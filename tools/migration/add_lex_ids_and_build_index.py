@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import filecmp
+import os
 import re
 import sys
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional
 
 import yaml
 
+# Prefer the LibYAML-backed C loader/dumper; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
 LEXICON_DIR = Path("linguistic_rules/lexicon")
 INDEX_PATH = LEXICON_DIR / "index.yaml"
@@ -22,10 +32,19 @@ MANAGED_FILES = [
     "numbers_time.yaml",
 ]
 
+# tools/ holds the shared yaml_items writer
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from yaml_items import dump_items_yaml  # noqa: E402
+
+# Parse lexicon files in worker processes only once their combined size makes
+# it worthwhile; below this, process start-up costs more than it saves.
+PARALLEL_LOAD_MIN_BYTES = 4 * 1024 * 1024
+
 # German articles (nominative singular; your PPT nouns are largely in this form)
-ARTICLES = {"der", "die", "das"}
+ARTICLES = frozenset({"der", "die", "das"})
 
-# Characters allowed in ID parts
+# Characters allowed in ID parts. "." is itself outside the class, so a
+# single sub also collapses pre-existing dot runs.
 NON_ID_CHARS = re.compile(r"[^A-Z0-9]+")
 
 # Some common German characters normalization
@@ -35,6 +54,13 @@ UMLAUT_MAP = str.maketrans({
     "ß": "SS",
 })
 
+# UMLAUT_MAP plus a-z -> A-Z, so non-ASCII tokens need one translate pass
+# instead of translate + upper().
+UPPER_UMLAUT_MAP = {
+    **UMLAUT_MAP,
+    **{ord(c): c.upper() for c in "abcdefghijklmnopqrstuvwxyz"},
+}
+
 # If you want to keep digits (e.g., "2026"), we keep them.
 # We also keep A-Z, 0-9 only, underscore removed in favor of dot-separated parts.
 
@@ -47,20 +73,61 @@ class SourceRef:
 
 def load_yaml(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_Loader) or {}
     if not isinstance(data, dict):
         raise ValueError(f"{path} did not parse to a dict.")
     return data
 
 
+def load_managed_files(paths: Dict[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load fname -> parsed YAML for each path, in a process pool when the
+    files are large enough (see PARALLEL_LOAD_MIN_BYTES). Order is preserved.
+    """
+    total_bytes = sum(p.stat().st_size for p in paths.values())
+    if len(paths) < 2 or total_bytes < PARALLEL_LOAD_MIN_BYTES:
+        return {fname: load_yaml(p) for fname, p in paths.items()}
+    with ProcessPoolExecutor(max_workers=len(paths)) as ex:
+        return dict(zip(paths.keys(), ex.map(load_yaml, paths.values())))
+
+
 def dump_yaml(path: Path, data: Dict[str, Any]) -> None:
     with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(data, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+
+
+def write_index_if_changed(
+    path: Path, header: Dict[str, Any], items: Iterable[Dict[str, Any]]
+) -> Tuple[bool, Optional[Path]]:
+    """
+    Stream the index to a sibling temp file and only swap it in (backing up
+    the old index) when the bytes differ. Returns (written, backup_path).
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        dump_items_yaml(tmp, header, items, sort_keys=False, allow_unicode=True)
+        if not path.exists():
+            os.replace(tmp, path)
+            return True, None
+        if filecmp.cmp(tmp, path, shallow=False):
+            tmp.unlink()
+            return False, None
+        bak = backup_file(path)
+        os.replace(tmp, path)
+        return True, bak
+    except BaseException:
+        # don't leave a partial index.yaml.tmp next to the real index
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def backup_file(path: Path) -> Path:
+    """
+    Move path aside to path.bak. Callers rewrite path immediately after,
+    so a rename is enough (no byte copy).
+    """
     bak = path.with_suffix(path.suffix + ".bak")
-    shutil.copy2(path, bak)
+    os.replace(path, bak)
     return bak
 
 
@@ -73,12 +140,16 @@ def to_id_token(s: str) -> str:
     """
     if not s:
         return ""
-    s = s.strip().translate(UMLAUT_MAP).upper()
-    s = NON_ID_CHARS.sub(".", s)
-    s = s.strip(".")
-    # Collapse repeated dots
-    s = re.sub(r"\.+", ".", s)
-    return s
+    s = s.strip()
+    if s.isascii():
+        # Nothing to normalize; upper() is the fastest pass here
+        s = s.upper()
+    else:
+        s = s.translate(UPPER_UMLAUT_MAP)
+        # Other non-ASCII letters (rare) still need the full Unicode upper()
+        if not s.isascii():
+            s = s.upper()
+    return NON_ID_CHARS.sub(".", s).strip(".")
 
 
 def parse_noun_text(text: str) -> Tuple[Optional[str], str]:
@@ -93,11 +164,17 @@ def parse_noun_text(text: str) -> Tuple[Optional[str], str]:
     if not t:
         return None, ""
     parts = t.split()
-    if len(parts) >= 2 and parts[0].lower() in ARTICLES:
-        return parts[0].lower(), " ".join(parts[1:])
+    if len(parts) >= 2:
+        head = parts[0]
+        # Articles are usually already lowercase; only lower() when needed
+        if head not in ARTICLES:
+            head = head.lower()
+        if head in ARTICLES:
+            return head, " ".join(parts[1:])
     return None, t
 
 
+@lru_cache(maxsize=32)
 def category_prefix(category: str) -> str:
     # category in your lexicon YAML: noun, verb, adjective, adverb, time_numbers (etc.)
     c = category.lower().strip()
@@ -115,17 +192,24 @@ def category_prefix(category: str) -> str:
     return f"LEX.{to_id_token(c) or 'ITEM'}"
 
 
-def make_lex_id(category: str, text: str) -> str:
+def make_lex_id(
+    cat_norm: str,
+    prefix: str,
+    text: str,
+    noun_parts: Optional[Tuple[Optional[str], str]] = None,
+) -> str:
     """
     Default ID strategy:
     - Noun: include article if present => LEX.NOUN.KATZE.DIE
     - Verb: lemma-like text => LEX.VERB.GEHEN
     - Others: tokenized text
-    """
-    prefix = category_prefix(category)
 
-    if category.lower().strip() == "noun":
-        art, core = parse_noun_text(text)
+    cat_norm is the lowercased category and prefix its category_prefix();
+    both are constant per file, so callers compute them once. noun_parts is
+    an already-computed parse_noun_text(text) result, if the caller has one.
+    """
+    if cat_norm == "noun":
+        art, core = noun_parts if noun_parts is not None else parse_noun_text(text)
         core_tok = to_id_token(core)
         if not core_tok:
             core_tok = "UNKNOWN"
@@ -144,53 +228,66 @@ def make_lex_id(category: str, text: str) -> str:
 def ensure_unique_id(proposed: str, used: Dict[str, int]) -> str:
     """
     If proposed already used, append .N where N increments.
+    Skips any .N that is itself already taken (e.g., a hand-assigned ID).
     """
-    if proposed not in used:
+    n = used.get(proposed, 0)
+    if n == 0:
         used[proposed] = 1
         return proposed
-    used[proposed] += 1
-    return f"{proposed}.{used[proposed]}"
+    while True:
+        n += 1
+        cand = f"{proposed}.{n}"
+        if cand not in used:
+            used[proposed] = n
+            used[cand] = 1
+            return cand
 
 
-def collect_all_existing_ids(files_data: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+def collect_all_existing_ids(files_data: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
     """
-    Return mapping: lex_id -> "file:idx" (first seen) to detect conflicts.
+    Return used-ID counts seeded from existing lex_ids (each marked used once),
+    ready to pass to ensure_unique_id.
     """
-    seen: Dict[str, str] = {}
-    for fname, data in files_data.items():
+    used: Dict[str, int] = {}
+    for data in files_data.values():
         items = data.get("items", [])
         if not isinstance(items, list):
             continue
-        for i, item in enumerate(items):
+        for item in items:
             if not isinstance(item, dict):
                 continue
             lex_id = item.get("lex_id")
             if isinstance(lex_id, str) and lex_id.strip():
-                key = lex_id.strip()
-                if key not in seen:
-                    seen[key] = f"{fname}:{i}"
-    return seen
+                used[lex_id.strip()] = 1
+    return used
 
 
-def build_index_entry(category: str, item: Dict[str, Any]) -> Dict[str, Any]:
+def build_index_entry(
+    category: str,
+    cat_norm: str,
+    item: Dict[str, Any],
+    text: str,
+    noun_parts: Optional[Tuple[Optional[str], str]] = None,
+) -> Dict[str, Any]:
     """
     Minimal index entry. Keep it compact but useful.
+    text is item.get("text", ""), already looked up by the caller.
     """
     entry: Dict[str, Any] = {
         "lex_id": item["lex_id"],
         "category": category,
-        "text": item.get("text", ""),
+        "text": text,
     }
 
     # Optional structured bits for nouns
-    if category.lower().strip() == "noun":
-        art, core = parse_noun_text(item.get("text", ""))
+    if cat_norm == "noun":
+        art, core = noun_parts if noun_parts is not None else parse_noun_text(text)
         if art:
             entry["article"] = art
-        entry["lemma"] = core.strip() if core else item.get("text", "")
+        entry["lemma"] = core.strip() if core else text
 
-    if category.lower().strip() == "verb":
-        entry["lemma"] = item.get("text", "").strip()
+    elif cat_norm == "verb":
+        entry["lemma"] = text.strip()
 
     # Copy sources if present (keeps provenance for reviewer safety)
     if "sources" in item:
@@ -205,30 +302,23 @@ def main() -> int:
         return 2
 
     # Load all managed YAML files that exist
-    files_data: Dict[str, Dict[str, Any]] = {}
-    for fname in MANAGED_FILES:
-        path = LEXICON_DIR / fname
-        if path.exists():
-            files_data[fname] = load_yaml(path)
+    paths = {fname: LEXICON_DIR / fname for fname in MANAGED_FILES}
+    files_data = load_managed_files({f: p for f, p in paths.items() if p.exists()})
 
     if not files_data:
         print("ERROR: No managed lexicon YAMLs found to process.", file=sys.stderr)
         return 2
 
-    # Track used IDs; start by collecting existing IDs
-    existing_id_first_seen = collect_all_existing_ids(files_data)
-    used_counts: Dict[str, int] = {}
+    # Track used IDs; existing IDs count as already used once
+    used_counts = collect_all_existing_ids(files_data)
 
-    # Seed used_counts with existing IDs as already used once
-    for lex_id in existing_id_first_seen.keys():
-        used_counts[lex_id] = 1
-
-    # Add missing IDs
+    # Add missing IDs; index entries are grouped by category as we go
     changed_files: List[str] = []
-    index_items: List[Dict[str, Any]] = []
+    index_by_category: Dict[str, List[Dict[str, Any]]] = {}
 
     for fname, data in files_data.items():
-        category = data.get("category", "").strip()
+        # Interned so every index entry (across files) shares one string
+        category = sys.intern(data.get("category", "").strip())
         items = data.get("items", [])
 
         if not category:
@@ -238,16 +328,23 @@ def main() -> int:
             print(f"ERROR: {fname} 'items' is not a list.", file=sys.stderr)
             return 2
 
+        cat_norm = category.lower()
+        prefix = category_prefix(cat_norm)
+        cat_entries = index_by_category.setdefault(category, [])
         file_changed = False
 
-        for i, item in enumerate(items):
+        for item in items:
             if not isinstance(item, dict):
                 continue
+            text = item.get("text", "")
+            lex_id = item.get("lex_id")
+
+            # Parse nouns once; both the ID and the index entry need it
+            noun_parts = parse_noun_text(text) if cat_norm == "noun" else None
 
             # Ensure lex_id exists
-            lex_id = item.get("lex_id")
             if not isinstance(lex_id, str) or not lex_id.strip():
-                proposed = make_lex_id(category, item.get("text", ""))
+                proposed = make_lex_id(cat_norm, prefix, text, noun_parts)
                 final_id = ensure_unique_id(proposed, used_counts)
                 item["lex_id"] = final_id
                 file_changed = True
@@ -256,7 +353,7 @@ def main() -> int:
                 item["lex_id"] = lex_id.strip()
 
             # Add to index list
-            index_items.append(build_index_entry(category, item))
+            cat_entries.append(build_index_entry(category, cat_norm, item, text, noun_parts))
 
         if file_changed:
             changed_files.append(fname)
@@ -267,34 +364,41 @@ def main() -> int:
             print(f"Updated IDs: {path}  (backup: {bak.name})")
 
     # Sort index entries by category then lex_id for readability
-    index_items.sort(key=lambda e: (e.get("category", ""), e.get("lex_id", "")))
+    def sorted_index_items() -> Iterator[Dict[str, Any]]:
+        for cat in sorted(index_by_category):
+            yield from sorted(index_by_category[cat], key=itemgetter("lex_id"))
+
+    index_count = sum(len(entries) for entries in index_by_category.values())
 
-    # Build index payload (schema v0.2)
-    index_payload: Dict[str, Any] = {
+    # Index payload header (schema v0.2); items are streamed after it
+    index_header: Dict[str, Any] = {
         "schema_version": "0.2",
         "rule_type": "lexicon",
         "language": "de",
         "description": "Master lexicon index with stable lex_id keys for linking grammar/morphology rules to lexical items.",
-        "items": index_items,
     }
 
+    # Final report is collected and written once
+    report: List[str] = []
+
     INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
-    if INDEX_PATH.exists():
-        bak = backup_file(INDEX_PATH)
-        dump_yaml(INDEX_PATH, index_payload)
-        print(f"Wrote: {INDEX_PATH} (backup: {bak.name})")
+    written, bak = write_index_if_changed(INDEX_PATH, index_header, sorted_index_items())
+    if not written:
+        report.append(f"Unchanged: {INDEX_PATH} (no rewrite needed)")
+    elif bak:
+        report.append(f"Wrote: {INDEX_PATH} (backup: {bak.name})")
     else:
-        dump_yaml(INDEX_PATH, index_payload)
-        print(f"Wrote: {INDEX_PATH}")
+        report.append(f"Wrote: {INDEX_PATH}")
 
     # Summary
-    print("\nSummary:")
+    report.append("\nSummary:")
     if changed_files:
-        print(f"  Updated lexicon files: {', '.join(changed_files)}")
+        report.append(f"  Updated lexicon files: {', '.join(changed_files)}")
     else:
-        print("  No lexicon files needed ID updates (already had lex_id).")
-    print(f"  Index items: {len(index_items)}")
-    print("\nNext: commit lexicon YAMLs + index.yaml.")
+        report.append("  No lexicon files needed ID updates (already had lex_id).")
+    report.append(f"  Index items: {index_count}")
+    report.append("\nNext: commit lexicon YAMLs + index.yaml.")
+    sys.stdout.write("\n".join(report) + "\n")
 
     return 0
 
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
 import re
+import shutil
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterator
 import yaml
 
+# Prefer the LibYAML-backed C loader; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# tools/ holds the shared yaml_items writer
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from yaml_items import dump_items_yaml  # noqa: E402
+
 LEXICON_DIR = Path("linguistic_rules/lexicon")
 
 # Map filename -> category + prefix
@@ -16,19 +31,15 @@ FILE_MAP = {
     "numbers_time.yaml": ("time_numbers", "T"),  # if an older name exists
 }
 
-ARTICLES = {"der", "die", "das"}
+ARTICLES = frozenset({"der", "die", "das"})
 
 
 def safe_load_yaml(path: Path) -> dict:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
-
-
-def safe_dump_yaml(path: Path, payload: dict) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(payload, f, sort_keys=False, allow_unicode=True)
+        return yaml.load(f, Loader=_Loader) or {}
 
 
+@lru_cache(maxsize=4096)
 def parse_gender_and_lemma(text: str) -> tuple[str | None, str | None]:
     """
     For noun entries like 'der Hund' -> ('der', 'Hund')
@@ -53,10 +64,65 @@ def normalize_sources(item: dict) -> list[dict]:
     out = []
     for s in sources:
         if isinstance(s, dict) and "ppt" in s and "slide" in s:
-            out.append({"ppt": s["ppt"], "slide": s["slide"]})
+            if len(s) == 2 and next(iter(s)) == "ppt":
+                # already {ppt, slide} in order: copy the table instead of
+                # rebuilding it (a copy, so the dumper never sees a shared
+                # object and emits an anchor)
+                out.append(s.copy())
+            else:
+                out.append({"ppt": s["ppt"], "slide": s["slide"]})
     return out
 
 
+def iter_new_items(decorated: list, category: str, prefix: str) -> Iterator[dict]:
+    """
+    Yield v0.2 entries for the sorted (key, text, sources) tuples,
+    numbering lex_ids in order and skipping empty texts.
+    """
+    counter = 1
+    # prefix is fixed per file; only the counter changes per item
+    id_template = f"LEX-{prefix}-A1-%04d"
+    for _key, text, srcs in decorated:
+        if not text:
+            continue
+
+        lex_id = id_template % counter
+        counter += 1
+
+        # Each entry is built as one literal with its final key set/order
+        # (no growing the dict with extra noun keys afterwards)
+        if category == "noun":
+            # Noun enrichment: gender + lemma from 'der Hund'
+            gender, lemma = parse_gender_and_lemma(text)
+            yield {
+                "lex_id": lex_id,
+                "text": text,
+                "pos": category,
+                "lemma": lemma if lemma else None,
+                "notes": None,
+                "sources": srcs,
+                "gender": gender,
+                "plural": None,  # keep null unless you explicitly add later
+            }
+            continue
+
+        # Verb lemma default: if it’s one token, assume it’s already infinitive.
+        # Adjective/adverb/time_numbers lemma: use raw text as lemma if single token
+        if category in {"verb", "adjective", "adverb", "time_numbers"}:
+            lemma = text if (" " not in text) else None
+        else:
+            lemma = None
+
+        yield {
+            "lex_id": lex_id,
+            "text": text,
+            "pos": category,
+            "lemma": lemma,
+            "notes": None,
+            "sources": srcs,
+        }
+
+
 def migrate_one_file(path: Path) -> None:
     name = path.name
     if name not in FILE_MAP:
@@ -75,70 +141,41 @@ def migrate_one_file(path: Path) -> None:
         items = []
 
     # Deterministic ordering so lex_id stays stable across reruns:
-    # sort by text, then by first source ppt/slide if present
-    def sort_key(it: dict):
+    # sort by text, then by first source ppt/slide if present.
+    # Decorate once (sort key, stripped text, normalized sources) so each
+    # item is stripped/normalized a single time and reused when building.
+    decorated = []
+    for it in items:
         txt = (it.get("text") or "").strip()
         srcs = normalize_sources(it)
         if srcs:
             first = srcs[0]
-            return (txt.lower(), str(first.get("ppt")), int(first.get("slide", 0)))
-        return (txt.lower(), "", 0)
-
-    items_sorted = sorted(items, key=sort_key)
-
-    new_items = []
-    counter = 1
-    for it in items_sorted:
-        text = (it.get("text") or "").strip()
-        if not text:
-            continue
-
-        lex_id = f"LEX-{prefix}-A1-{counter:04d}"
-        counter += 1
-
-        entry = {
-            "lex_id": lex_id,
-            "text": text,
-            "pos": category,
-            "lemma": None,
-            "notes": None,
-            "sources": normalize_sources(it),
-        }
-
-        # Noun enrichment if applicable
-        if category == "noun":
-            gender, lemma = parse_gender_and_lemma(text)
-            entry["gender"] = gender
-            entry["lemma"] = lemma if lemma else None
-            entry["plural"] = None  # keep null unless you explicitly add later
-
-        # Verb lemma default: if it’s one token, assume it’s already infinitive
-        if category == "verb":
-            entry["lemma"] = text if (" " not in text) else None
-
-        # Adjective/adverb/time_numbers lemma: use raw text as lemma if single token
-        if category in {"adjective", "adverb", "time_numbers"}:
-            entry["lemma"] = text if (" " not in text) else None
-
-        new_items.append(entry)
+            key = (txt.lower(), str(first.get("ppt")), int(first.get("slide", 0)))
+        else:
+            key = (txt.lower(), "", 0)
+        decorated.append((key, txt, srcs))
+    decorated.sort(key=itemgetter(0))
 
-    payload = {
+    header = {
         "schema_version": "0.2",
         "rule_type": "lexicon",
         "language": "de",
         "cefr_level": "A1",
         "category": category,
         "source": old.get("source", "pptx_extraction"),
-        "items": new_items,
     }
+    # decorated holds everything still needed; drop the parsed input tree
+    del old, items
 
     # Backup original once
     backup = path.with_suffix(path.suffix + ".bak")
     if not backup.exists():
-        backup.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
+        shutil.copyfile(path, backup)
 
-    safe_dump_yaml(path, payload)
-    print(f"Migrated: {path}  (items: {len(new_items)})  backup: {backup.name}")
+    written = dump_items_yaml(
+        path, header, iter_new_items(decorated, category, prefix), sort_keys=False, allow_unicode=True
+    )
+    print(f"Migrated: {path}  (items: {written})  backup: {backup.name}")
 
 
 def main():
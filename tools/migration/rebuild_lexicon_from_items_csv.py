@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import csv
 import re
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-import yaml
+
+# tools/ holds the shared yaml_items writer
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from yaml_items import dump_items_yaml  # noqa: E402
 
 ITEMS_CSV = Path("docs/ppt_extracted/items.csv")
 OUT_DIR = Path("linguistic_rules/lexicon")
@@ -22,8 +28,12 @@ ALLOW_TOKENS = {
     "time_numbers": 4,
 }
 
-PUNCT = set("?!:;")
+PUNCT = frozenset("?!:;")
+TIME_RE = re.compile(r"\d{1,2}:\d{2}")
+NUMBER_RE = re.compile(r"\d+")
 
+# norm_text values repeat across slides/decks, so memoize per (text, category)
+@lru_cache(maxsize=65536)
 def looks_like_lexicon(text: str, category: str) -> bool:
     t = (text or "").strip()
     if not t:
@@ -34,7 +44,7 @@ def looks_like_lexicon(text: str, category: str) -> bool:
         return False
 
     # reject obvious sentence punctuation (but allow dot in times like 12.30)
-    if any(ch in t for ch in PUNCT):
+    if not PUNCT.isdisjoint(t):
         return False
 
     tokens = t.split()
@@ -57,17 +67,41 @@ def looks_like_lexicon(text: str, category: str) -> bool:
     # time_numbers: allow tokens like "morgen", "heute Abend", "12:30"
     if category == "time_numbers":
         # allow times and numbers
-        if re.fullmatch(r"\d{1,2}:\d{2}", t):
+        if TIME_RE.fullmatch(t):
             return True
-        if re.fullmatch(r"\d+", t):
+        if NUMBER_RE.fullmatch(t):
             return True
 
     return True
 
 
+ROW_FIELDS = ("category", "norm_text", "ppt_file", "slide_number")
+
+
 def load_rows():
+    """
+    Yield (category, norm_text, ppt_file, slide_number) per CSV row.
+    Uses csv.reader + column indices rather than a dict per row; like
+    DictReader, blank lines are skipped and missing cells/columns are None.
+    """
     with ITEMS_CSV.open("r", encoding="utf-8") as f:
-        yield from csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # last occurrence wins for duplicate header names, as in DictReader
+        pos = {name: i for i, name in enumerate(header)}
+        idx = [pos.get(name) for name in ROW_FIELDS]
+        need = max((i for i in idx if i is not None), default=-1) + 1
+        fast = itemgetter(*idx) if None not in idx else None
+        for row in reader:
+            if not row:
+                continue
+            if fast is not None and len(row) >= need:
+                yield fast(row)
+            else:
+                yield tuple(
+                    row[i] if i is not None and i < len(row) else None
+                    for i in idx
+                )
 
 
 def main():
@@ -84,20 +118,20 @@ def main():
         "time_numbers": {},
     }
 
-    for r in load_rows():
-        cat = (r.get("category") or "").strip()
+    for cat, text, ppt_file, slide_number in load_rows():
+        cat = (cat or "").strip()
         if cat not in buckets:
             continue
 
-        text = (r.get("norm_text") or "").strip()
+        text = (text or "").strip()
         if not looks_like_lexicon(text, cat):
             continue
 
         key = text
         buckets[cat].setdefault(key, {"text": text, "sources": []})
         buckets[cat][key]["sources"].append({
-            "ppt": r.get("ppt_file"),
-            "slide": int(r.get("slide_number") or 0),
+            "ppt": ppt_file,
+            "slide": int(slide_number or 0),
         })
 
     # write raw v0.1-style lexicon YAMLs so your migrate script can re-run cleanly
@@ -110,16 +144,15 @@ def main():
     }
 
     for cat, fname in outfiles.items():
-        payload = {
+        header = {
             "schema_version": "0.1",
             "source": "items_csv_rebuild",
             "category": cat,
-            "items": sorted(buckets[cat].values(), key=lambda x: x["text"].lower()),
         }
+        items = sorted(buckets[cat].values(), key=lambda x: x["text"].lower())
         p = OUT_DIR / fname
-        with p.open("w", encoding="utf-8") as f:
-            yaml.safe_dump(payload, f, sort_keys=False, allow_unicode=True)
-        print(f"Wrote {p} ({len(payload['items'])} items)")
+        dump_items_yaml(p, header, items, sort_keys=False, allow_unicode=True)
+        print(f"Wrote {p} ({len(items)} items)")
 
 if __name__ == "__main__":
     main()
@@ -10,11 +10,20 @@ Checks:
 
 from __future__ import annotations
 
+import codecs
+from concurrent.futures import ProcessPoolExecutor
+import io
+import os
 from pathlib import Path
 import sys
 import yaml
-import re
-from typing import Any, Dict, Set, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+# Prefer the LibYAML-backed C loader; fall back to pure Python.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
 ROOT = Path(".")
 LEX_INDEX = ROOT / "linguistic_rules" / "lexicon" / "index.yaml"
@@ -25,50 +34,156 @@ SCAN_DIRS = [
     ROOT / "linguistic_rules" / "morphology",
 ]
 
-LEX_ID_KEY_RE = re.compile(r".*_lex_id$")
+LEX_ID_KEY_SUFFIX = "_lex_id"
+LEX_ID_KEY_BYTES = LEX_ID_KEY_SUFFIX.encode("utf-8")
+
+# The loader also accepts UTF-16 input; there (and in UTF-32) the key bytes
+# are interleaved with NULs, so the byte check only applies to UTF-8.
+WIDE_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, codecs.BOM_UTF32_BE)
+
+# Scan rule files in worker processes only once their combined size makes
+# it worthwhile; below this, process start-up costs more than it saves.
+PARALLEL_SCAN_MIN_BYTES = 4 * 1024 * 1024
+
+
+def yaml_stream(path: Path, raw: bytes) -> io.BytesIO:
+    """raw as a stream named after path, so parse errors still cite the file."""
+    stream = io.BytesIO(raw)
+    stream.name = str(path)
+    return stream
+
+
+def is_utf8_yaml(raw: bytes) -> bool:
+    """True unless raw starts with a UTF-16/32 BOM or has a NUL in its first bytes."""
+    return not raw.startswith(WIDE_BOMS) and b"\0" not in raw[:4]
 
 
 def load_yaml(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # Hand libyaml the raw bytes (it detects UTF-8 itself) instead of a text wrapper
+    return yaml.load(yaml_stream(path, path.read_bytes()), Loader=_Loader)
 
 
-def collect_lex_ids(index_data: Dict[str, Any]) -> Set[str]:
-    ids: Set[str] = set()
-    for it in index_data.get("items", []):
-        lex_id = it.get("lex_id")
-        if lex_id:
-            ids.add(str(lex_id))
-    return ids
+def collect_lex_ids(index_data: Dict[str, Any]) -> FrozenSet[str]:
+    # One comprehension instead of an ids.add() call per index item
+    lex_ids = [it.get("lex_id") for it in index_data.get("items", [])]
+    return frozenset([
+        lex_id if isinstance(lex_id, str) else str(lex_id)
+        for lex_id in lex_ids
+        if lex_id
+    ])
+
+
+def walk_yaml(root: str) -> Iterator[str]:
+    """
+    Yield path strings for *.yaml entries under root, like Path.rglob("*.yaml")
+    but straight off os.scandir (no Path object per visited entry).
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except PermissionError:
+        return
+    for entry in entries:
+        if entry.name.endswith(".yaml"):
+            yield entry.path
+        if entry.is_dir(follow_symlinks=False):
+            yield from walk_yaml(entry.path)
 
 
 def iter_yaml_files() -> List[Path]:
     files: List[Path] = []
     for d in SCAN_DIRS:
         if d.exists():
-            files.extend(sorted(d.rglob("*.yaml")))
+            # sort by path components, as sorted(Path, ...) did
+            found = sorted(walk_yaml(str(d)), key=lambda s: s.split(os.sep))
+            files.extend(Path(s) for s in found)
     return files
 
 
+def render_path(parts: Tuple[Union[str, int], ...]) -> str:
+    """
+    Join path parts (keys as str, list indices as int) into a field path
+    like 'rules[0].verb_lex_id'.
+    """
+    path = ""
+    for part in parts:
+        if isinstance(part, int):
+            path = f"{path}[{part}]"
+        else:
+            path = f"{path}.{part}" if path else part
+    return path
+
+
+def _walk_lex_id_refs(node: Any, parts: Tuple[Union[str, int], ...], found: List[Tuple[str, str]]) -> None:
+    if isinstance(node, dict):
+        for k, v in node.items():
+            k_str = k if isinstance(k, str) else str(k)
+            if k_str.endswith(LEX_ID_KEY_SUFFIX) and v is not None:
+                found.append((render_path(parts + (k_str,)), v if isinstance(v, str) else str(v)))
+            # scalar leaves have nothing to walk
+            if isinstance(v, (dict, list)):
+                _walk_lex_id_refs(v, parts + (k_str,), found)
+    else:
+        for i, v in enumerate(node):
+            if isinstance(v, (dict, list)):
+                _walk_lex_id_refs(v, parts + (i,), found)
+
+
 def find_lex_id_refs(obj: Any, path: str = "") -> List[Tuple[str, str]]:
     """
     Return list of (field_path, lex_id_value) for any *_lex_id keys found in obj.
+
+    Field paths are carried as part tuples and only rendered on a match.
     """
     found: List[Tuple[str, str]] = []
+    if isinstance(obj, (dict, list)):
+        _walk_lex_id_refs(obj, (path,) if path else (), found)
+    return found
 
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            k_str = str(k)
-            subpath = f"{path}.{k_str}" if path else k_str
-            if LEX_ID_KEY_RE.match(k_str) and v is not None:
-                found.append((subpath, str(v)))
-            found.extend(find_lex_id_refs(v, subpath))
-    elif isinstance(obj, list):
-        for i, v in enumerate(obj):
-            subpath = f"{path}[{i}]"
-            found.extend(find_lex_id_refs(v, subpath))
 
-    return found
+def scan_file(path: Path) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """
+    Parse one YAML file and return (refs, None), or ([], message) if it
+    does not parse. Runs in worker processes, so errors come back as text.
+
+    Every file is fully loaded, so constructor errors (unknown tags, bad
+    timestamps, ...) are still reported. UTF-8 files whose bytes never
+    mention "_lex_id" cannot hold a ref, so their trees are not walked.
+    """
+    try:
+        raw = path.read_bytes()
+        docs = list(yaml.load_all(yaml_stream(path, raw), Loader=_Loader))
+    except Exception as e:
+        return [], str(e)
+    if LEX_ID_KEY_BYTES not in raw and is_utf8_yaml(raw):
+        return [], None
+    if len(docs) == 1:
+        return find_lex_id_refs(docs[0]), None
+    # multi-document file: tag each ref with its document number
+    refs: List[Tuple[str, str]] = []
+    for n, doc in enumerate(docs, 1):
+        refs.extend((f"(doc {n}) {field_path}", ref_id) for field_path, ref_id in find_lex_id_refs(doc))
+    return refs, None
+
+
+def file_size(path: Path) -> int:
+    """Size of path in bytes, or 0 if it cannot be stat'ed (scan_file reports it)."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def scan_files(paths: List[Path]) -> List[Tuple[List[Tuple[str, str]], Optional[str]]]:
+    """
+    scan_file for each path, in a process pool when the files are large
+    enough (see PARALLEL_SCAN_MIN_BYTES). Order is preserved.
+    """
+    total_bytes = sum(map(file_size, paths))
+    if len(paths) < 2 or total_bytes < PARALLEL_SCAN_MIN_BYTES:
+        return [scan_file(p) for p in paths]
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(scan_file, paths, chunksize=8))
 
 
 def main() -> int:
@@ -90,15 +205,12 @@ def main() -> int:
     errors = 0
     checked = 0
 
-    for ypath in yaml_files:
-        try:
-            data = load_yaml(ypath)
-        except Exception as e:
-            print(f"ERROR: failed to parse YAML: {ypath} :: {e}")
+    for ypath, (refs, parse_error) in zip(yaml_files, scan_files(yaml_files)):
+        if parse_error is not None:
+            print(f"ERROR: failed to parse YAML: {ypath} :: {parse_error}")
             errors += 1
             continue
 
-        refs = find_lex_id_refs(data)
         if not refs:
             continue
 
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Streaming writer for {header..., items: [...]} YAML files.
+
+The header keys are dumped first, then `items:`, then each entry with its own
+yaml.dump call, so the emitter never builds a representation graph for the
+whole file. Output is byte-identical to
+yaml.dump({**header, "items": list(items)}, **dump_kw).
+
+Used by:
+  - tools/lexicon/clean_and_classify_verbs.py
+  - tools/lexicon/split_cefr_core_to_pos_lexicon.py
+  - tools/migration/add_lex_ids_and_build_index.py
+  - tools/migration/migrate_lexicon_schema_v0_2.py
+  - tools/migration/rebuild_lexicon_from_items_csv.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+import yaml
+
+# Prefer the LibYAML-backed C dumper; fall back to pure Python.
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+def dump_items_yaml(
+    path: Union[str, Path],
+    header: Dict[str, Any],
+    items: Iterable[Dict[str, Any]],
+    **dump_kw: Any,
+) -> int:
+    """
+    Write header keys, then stream `items:` to path. dump_kw goes to every
+    yaml.dump call (sort_keys, allow_unicode, width, ...). Returns the item count.
+    """
+    n = 0
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump(header, f, Dumper=_Dumper, **dump_kw)
+        for entry in items:
+            if not n:
+                f.write("items:\n")
+            yaml.dump([entry], f, Dumper=_Dumper, **dump_kw)
+            n += 1
+        if not n:
+            f.write("items: []\n")
+    return n